@@ -1,4 +1,9 @@
+try:
+    import orjson
+except ImportError:
+    orjson = None
 import json
+from functools import cached_property
 from tool_service.connection import ConnectionHandler as CH
 from tool_service.util.logger import save_logs_to_file
 
@@ -7,16 +12,23 @@ class RequestRunner:
     def __init__(self, request_file="mocks/request.json"):
         self.request_file = request_file
 
+    @cached_property
+    def payload(self):
+        """Request payload, read from disk once per runner."""
+        return self.load_request()
+
     def load_request(self):
         """Load request payload from JSON file."""
+        if orjson is not None:
+            with open(self.request_file, "rb") as f:
+                return orjson.loads(f.read())
         with open(self.request_file) as f:
             return json.load(f)
 
     def run(self):
         """Execute the request and return result."""
-        request_payload = self.load_request()
         handler = CH()
-        result = handler.handle_request(request_payload)
+        result = handler.handle_request(self.payload)
         return result
 
 
@@ -2,10 +2,10 @@ from unittest.mock import patch
 from tool_service.connection import ConnectionHandler
 
 
-@patch("tool_service.connection.DT")
-def test_handle_request_success(mock_dt):
+@patch("tool_service.connection.get_transformer")
+def test_handle_request_success(mock_get_transformer):
     # Mock transformer success
-    mock_transformer = mock_dt.return_value
+    mock_transformer = mock_get_transformer.return_value
     mock_transformer.transform_data.return_value = {"rows_loaded": 5}
 
     handler = ConnectionHandler()
@@ -24,10 +24,10 @@ def test_handle_request_success(mock_dt):
     mock_transformer.transform_data.assert_called_once()
 
 
-@patch("tool_service.connection.DT")
-def test_handle_request_failure(mock_dt):
+@patch("tool_service.connection.get_transformer")
+def test_handle_request_failure(mock_get_transformer):
     # Mock transformer raising exception
-    mock_transformer = mock_dt.return_value
+    mock_transformer = mock_get_transformer.return_value
     mock_transformer.transform_data.side_effect = Exception("Pipeline error")
 
     handler = ConnectionHandler()
@@ -41,4 +41,8 @@ def test_handle_request_failure(mock_dt):
     result = handler.handle_request(request)
 
     assert result["status"] == "failed"
-    assert "Pipeline error" in result["error"]
\ No newline at end of file
+    assert "Pipeline error" in result["error"]
+
+
+def test_handlers_share_one_transformer():
+    assert ConnectionHandler().transformer is ConnectionHandler().transformer
@@ -1,10 +1,13 @@
 import pandas as pd
 import pytest
 from unittest.mock import MagicMock, patch
+from sqlalchemy import Table, text
 from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.pool import StaticPool
 from pandas.errors import ParserError
 
-from tool_service.src.load_sql import SQLDataFrameLoader
+from tool_service.src.load_sql import SQLDataFrameLoader, _get_engine, _get_schema_cache
+from tool_service.src.sql_insert_methods import psql_insert_copy
 
 
 class DummyLogger:
@@ -13,12 +16,64 @@ class DummyLogger:
     def warning(self, *args, **kwargs): pass
 
 
+@pytest.fixture(autouse=True)
+def clear_engine_cache():
+    _get_engine.cache_clear()
+    _get_schema_cache.cache_clear()
+    yield
+    _get_engine.cache_clear()
+    _get_schema_cache.cache_clear()
+
+
 # ---------- Engine Initialization ----------
 
 @patch("tool_service.src.load_sql.create_engine")
 def test_engine_initialization(mock_create_engine):
     destination = {"db_type": "sqlite", "connection": {"database": "test.db"}}
-    SQLDataFrameLoader(DummyLogger(), destination)
+    loader = SQLDataFrameLoader(DummyLogger(), destination)
+    mock_create_engine.assert_not_called()
+
+    assert loader.engine is mock_create_engine.return_value
+    mock_create_engine.assert_called_once()
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_engine_pool_options(mock_create_engine):
+    dest = {"db_type": "postgresql", "connection": {"database": "d"}}
+    SQLDataFrameLoader(DummyLogger(), dest).engine
+
+    options = mock_create_engine.call_args.kwargs
+    assert options["pool_size"] == 10
+    assert options["pool_pre_ping"] is True
+    assert options["pool_recycle"] == 3600
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_sqlite_memory_engine_uses_static_pool(mock_create_engine):
+    dest = {"db_type": "sqlite", "connection": {"database": ":memory:"}}
+    SQLDataFrameLoader(DummyLogger(), dest).engine
+
+    options = mock_create_engine.call_args.kwargs
+    assert options["poolclass"] is StaticPool
+    assert options["connect_args"] == {"check_same_thread": False}
+
+
+def test_sqlite_file_engine_gives_each_transaction_its_own_connection(tmp_path):
+    dest = {"db_type": "sqlite", "connection": {"database": str(tmp_path / "test.db")}}
+    engine = SQLDataFrameLoader(DummyLogger(), dest).engine
+
+    assert not isinstance(engine.pool, StaticPool)
+    with engine.connect() as first, engine.connect() as second:
+        assert first.connection.dbapi_connection is not second.connection.dbapi_connection
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_engine_is_reused_across_loaders(mock_create_engine):
+    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
+    first = SQLDataFrameLoader(DummyLogger(), dest)
+    second = SQLDataFrameLoader(DummyLogger(), dest)
+
+    assert first.engine is second.engine
     mock_create_engine.assert_called_once()
 
 
@@ -64,6 +119,21 @@ def test_mssql_connection_string_no_password(mock_engine):
     assert "mssql+pymssql://" in loader._build_connection_string()
 
 
+@patch("tool_service.src.load_sql.create_engine")
+def test_mssql_pyodbc_enables_fast_executemany(mock_engine):
+    dest = {
+        "db_type": "mssql",
+        "connection": {"user": "u", "password": "p", "host": "h", "port": 1433, "database": "d", "driver": "pyodbc"}
+    }
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    loader.engine
+    url = loader._build_connection_string()
+    assert url.startswith("mssql+pyodbc://u:p@h:1433/d?driver=ODBC+Driver+18")
+    assert mock_engine.call_args.kwargs["fast_executemany"] is True
+    assert loader._insert_method() is None
+
+
 def test_unsupported_db_type():
     dest = {"db_type": "oracle", "connection": {}}
     with pytest.raises(ValueError):
@@ -118,7 +188,211 @@ def test_load_dataframe_success(mock_engine):
     with patch.object(df, "to_sql") as mock_to_sql:
         result = loader.load_dataframe_to_sql(df)
 
-    assert result is True
+    assert result == {"success": True, "table": "users", "rows_loaded": 2}
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_load_dataframe_uses_multi_row_inserts(mock_engine):
+    df = pd.DataFrame({"id": [1, 2]})
+    dest = {"db_type": "mssql", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest, chunk_size=500)
+
+    with patch.object(df, "to_sql") as mock_to_sql:
+        loader.load_dataframe_to_sql(df)
+
+    assert mock_to_sql.call_args.kwargs["method"] == "multi"
+    assert mock_to_sql.call_args.kwargs["chunksize"] == 500
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_load_dataframe_sqlite_uses_executemany(mock_engine):
+    df = pd.DataFrame({"id": [1, 2]})
+    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.object(df, "to_sql") as mock_to_sql:
+        loader.load_dataframe_to_sql(df)
+
+    assert mock_to_sql.call_args.kwargs["method"] is None
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_load_dataframe_method_override(mock_engine):
+    df = pd.DataFrame({"id": [1, 2]})
+    dest = {"db_type": "postgresql", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.object(df, "to_sql") as mock_to_sql:
+        loader.load_dataframe_to_sql(df, method="multi", chunk_size=50)
+
+    assert mock_to_sql.call_args.kwargs["method"] == "multi"
+    assert mock_to_sql.call_args.kwargs["chunksize"] == 50
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_load_dataframe_mssql_chunk_size_respects_param_limit(mock_engine):
+    df = pd.DataFrame({f"c{i}": [1] for i in range(10)})
+    dest = {"db_type": "mssql", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.object(df, "to_sql") as mock_to_sql:
+        loader.load_dataframe_to_sql(df)
+
+    assert mock_to_sql.call_args.kwargs["chunksize"] == 209
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_load_dataframe_postgres_uses_copy(mock_engine):
+    df = pd.DataFrame({"id": [1, 2]})
+    dest = {"db_type": "postgresql", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.object(df, "to_sql") as mock_to_sql:
+        loader.load_dataframe_to_sql(df)
+
+    assert mock_to_sql.call_args.kwargs["method"] is psql_insert_copy
+
+
+def test_load_dataframe_streams_large_frames(tmp_path):
+    df = pd.DataFrame({"id": range(5), "name": ["a", None, "c", "d", "e"]})
+    dest = {"db_type": "sqlite", "connection": {"database": str(tmp_path / "test.db")}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest, stream_threshold=2)
+
+    with patch.object(df, "to_sql", wraps=df.to_sql) as mock_to_sql:
+        assert loader.load_dataframe_to_sql(df, chunk_size=2)["rows_loaded"] == 5
+
+    mock_to_sql.assert_not_called()
+    loaded = pd.read_sql("SELECT * FROM users", loader.engine)
+    assert loaded["id"].tolist() == [0, 1, 2, 3, 4]
+    assert loaded["name"].tolist() == ["a", None, "c", "d", "e"]
+
+    assert loader.load_dataframe_to_sql(df, if_exists="append")["success"] is True
+    assert len(pd.read_sql("SELECT * FROM users", loader.engine)) == 10
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_fast_insert_uses_parallel_workers(mock_engine):
+    df = pd.DataFrame({"id": range(5)})
+    dest = {"db_type": "postgresql", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest, max_workers=4)
+
+    with patch("tool_service.src.load_sql.Table"), \
+            patch.object(pd.DataFrame, "to_sql"), \
+            patch.object(loader, "_insert_chunk") as mock_insert_chunk:
+        loader._fast_insert(df, "users", "replace", 2)
+
+    assert loader._insert_workers() == 4
+    assert mock_insert_chunk.call_count == 3
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_sqlite_inserts_serially(mock_engine):
+    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
+    loader = SQLDataFrameLoader(DummyLogger(), dest, max_workers=4)
+
+    assert loader._insert_workers() == 1
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_load_dataframe_adbc_ingest(mock_engine):
+    df = pd.DataFrame({"id": [1, 2]})
+    dest = {"db_type": "postgresql_adbc", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.object(loader, "_adbc_ingest") as mock_ingest, patch.object(df, "to_sql") as mock_to_sql:
+        assert loader.load_dataframe_to_sql(df)["rows_loaded"] == 2
+
+    mock_ingest.assert_called_once_with(df, "users", "replace", False)
+    mock_to_sql.assert_not_called()
+
+
+def test_adbc_ingest_hands_arrow_table_to_driver():
+    pa = pytest.importorskip("pyarrow")
+    adbc_module = MagicMock()
+    adbc_connection = adbc_module.dbapi.connect.return_value.__enter__.return_value
+    cursor = adbc_connection.cursor.return_value.__enter__.return_value
+
+    dest = {"db_type": "postgresql_adbc", "connection": {"user": "u", "host": "h", "database": "d"}}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.dict("sys.modules", {"adbc_driver_postgresql": adbc_module,
+                                    "adbc_driver_postgresql.dbapi": adbc_module.dbapi}):
+        loader._adbc_ingest(pd.DataFrame({"id": [1]}), "users", "append")
+
+    adbc_module.dbapi.connect.assert_called_once_with("postgresql://u@h:5432/d")
+    table_name, arrow_table = cursor.adbc_ingest.call_args.args
+    assert table_name == "users"
+    assert isinstance(arrow_table, pa.Table)
+    assert cursor.adbc_ingest.call_args.kwargs["mode"] == "create_append"
+    adbc_connection.commit.assert_called_once()
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_connection_uses_given_connection(mock_engine):
+    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+    conn = MagicMock()
+
+    result = loader.test_connection(conn)
+
+    assert result["success"] is True
+    conn.execute.assert_called_once()
+    mock_engine.return_value.connect.assert_not_called()
+
+
+def test_load_dataframe_downcast(tmp_path):
+    dest = {"db_type": "sqlite", "connection": {"database": str(tmp_path / "test.db")}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+    df = pd.DataFrame({"id": [1, 2, 3, 4], "score": [0.5, 1.5, 2.5, 3.5], "city": ["a", "a", "b", "a"]})
+
+    downcast = loader._downcast(df)
+    result = loader.load_dataframe_to_sql(df, downcast=True)
+
+    assert downcast.dtypes.tolist() == ["int8", "float32", "category"]
+    assert df["id"].dtype == "int64"
+    assert loader._downcast(pd.DataFrame({"score": [0.1, 0.123456789]}))["score"].dtype == "float64"
+    assert result["success"] is True
+    assert pd.read_sql("SELECT * FROM users", loader.engine)["city"].tolist() == ["a", "a", "b", "a"]
+
+
+def test_load_arrow_stream_to_sql_without_adbc(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    batches = [pa.record_batch({"id": [1, 2]}), pa.record_batch({"id": [3]})]
+    reader = pa.RecordBatchReader.from_batches(batches[0].schema, batches)
+
+    dest = {"db_type": "sqlite", "connection": {"database": str(tmp_path / "test.db")}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    result = loader.load_arrow_stream_to_sql(reader)
+
+    assert result == {"success": True, "table": "users", "rows_loaded": 3}
+    assert pd.read_sql("SELECT * FROM users", loader.engine)["id"].tolist() == [1, 2, 3]
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_load_arrow_stream_to_sql_with_adbc(mock_engine):
+    dest = {"db_type": "postgresql_adbc", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.object(loader, "_adbc_ingest", return_value=3) as mock_ingest:
+        result = loader.load_arrow_stream_to_sql("reader", if_exists="append")
+
+    mock_ingest.assert_called_once_with("reader", "users", "append")
+    assert result["rows_loaded"] == 3
+
+
+@patch("tool_service.src.load_sql.create_engine", side_effect=ModuleNotFoundError("psycopg2"))
+def test_adbc_loads_never_create_the_engine(mock_create_engine):
+    dest = {"db_type": "postgresql_adbc", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.object(loader, "_adbc_ingest", return_value=2):
+        frame_result = loader.load_dataframe_to_sql(pd.DataFrame({"id": [1, 2]}))
+        stream_result = loader.load_arrow_stream_to_sql("reader")
+
+    assert frame_result["success"] is True
+    assert stream_result["success"] is True
+    mock_create_engine.assert_not_called()
 
 
 @patch("tool_service.src.load_sql.create_engine")
@@ -127,7 +401,7 @@ def test_load_dataframe_empty(mock_engine):
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}, "table": "users"}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
-    assert loader.load_dataframe_to_sql(df) is False
+    assert loader.load_dataframe_to_sql(df)["success"] is False
 
 
 @patch("tool_service.src.load_sql.create_engine")
@@ -136,7 +410,7 @@ def test_load_dataframe_missing_table(mock_engine):
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
-    assert loader.load_dataframe_to_sql(df) is False
+    assert loader.load_dataframe_to_sql(df)["success"] is False
 
 
 @patch("tool_service.src.load_sql.create_engine")
@@ -146,7 +420,7 @@ def test_load_dataframe_sqlalchemy_error(mock_engine):
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
     with patch.object(df, "to_sql", side_effect=SQLAlchemyError("sql error")):
-        assert loader.load_dataframe_to_sql(df) is False
+        assert loader.load_dataframe_to_sql(df)["success"] is False
 
 
 @patch("tool_service.src.load_sql.create_engine")
@@ -156,26 +430,64 @@ def test_load_dataframe_generic_exception(mock_engine):
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
     with patch.object(df, "to_sql", side_effect=Exception("boom")):
-        assert loader.load_dataframe_to_sql(df) is False
+        assert loader.load_dataframe_to_sql(df)["success"] is False
 
 
 # ---------- CSV Loading ----------
 
 @patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.pd.read_csv")
+@patch("pandas.read_csv")
 def test_load_csv_to_database_success(mock_read_csv, mock_engine):
     df = pd.DataFrame({"id": [1]})
-    mock_read_csv.return_value = df
+    mock_read_csv.return_value = iter([df])
 
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}, "table": "users"}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
-    with patch.object(loader, "load_dataframe_to_sql", return_value=True):
+    loaded = {"success": True, "table": "users", "rows_loaded": 1}
+    with patch.object(loader, "load_dataframe_to_sql", return_value=loaded):
         assert loader.load_csv_to_database("file.csv") is True
 
 
 @patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.pd.read_csv", side_effect=FileNotFoundError)
+@patch("pandas.read_csv")
+def test_load_csv_to_database_appends_after_first_chunk(mock_read_csv, mock_engine):
+    first, second = pd.DataFrame({"id": [1]}), pd.DataFrame({"id": [2]})
+    mock_read_csv.return_value = iter([first, second])
+
+    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    loaded = {"success": True, "table": "users", "rows_loaded": 1}
+    with patch.object(loader, "load_dataframe_to_sql", return_value=loaded) as mock_load:
+        assert loader.load_csv_to_database("file.csv", chunksize=1) is True
+
+    assert mock_read_csv.call_args.kwargs["chunksize"] == 1
+    assert mock_read_csv.call_args.kwargs["memory_map"] is True
+    assert [c.args[2] for c in mock_load.call_args_list] == ["replace", "append"]
+
+
+def test_load_csv_to_database_rolls_back_failed_load(tmp_path):
+    file_path = tmp_path / "users.csv"
+    pd.DataFrame({"id": [1, 2, 3]}).to_csv(file_path, index=False)
+    dest = {"db_type": "sqlite", "connection": {"database": str(tmp_path / "test.db")}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+    loader.load_dataframe_to_sql(pd.DataFrame({"id": [9]}))
+
+    real_load = loader.load_dataframe_to_sql
+    results = iter([None, {"success": False, "table": "users", "rows_loaded": 0}])
+
+    def load_then_fail(*args, **kwargs):
+        return next(results) or real_load(*args, **kwargs)
+
+    with patch.object(loader, "load_dataframe_to_sql", side_effect=load_then_fail):
+        assert loader.load_csv_to_database(str(file_path), if_exists="append", chunksize=1) is False
+
+    assert pd.read_sql("SELECT * FROM users", loader.engine)["id"].tolist() == [9]
+
+
+@patch("tool_service.src.load_sql.create_engine")
+@patch("pandas.read_csv", side_effect=FileNotFoundError)
 def test_load_csv_file_not_found(mock_read, mock_engine):
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
@@ -184,7 +496,7 @@ def test_load_csv_file_not_found(mock_read, mock_engine):
 
 
 @patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.pd.read_csv", side_effect=ParserError("bad csv"))
+@patch("pandas.read_csv", side_effect=ParserError("bad csv"))
 def test_load_csv_parser_error(mock_read, mock_engine):
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
@@ -192,34 +504,166 @@ def test_load_csv_parser_error(mock_read, mock_engine):
     assert loader.load_csv_to_database("bad.csv") is False
 
 
-# ---------- Table Inspection ----------
-
 @patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.inspect")
-def test_get_table_info_missing(mock_inspect, mock_engine):
-    mock_inspector = mock_inspect.return_value
-    mock_inspector.has_table.return_value = False
+def test_load_csv_direct_postgres_uses_copy(mock_engine, tmp_path):
+    file_path = tmp_path / "users.csv"
+    pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}).to_csv(file_path, index=False)
 
-    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
+    dest = {"db_type": "postgresql", "connection": {"database": "d"}, "table": "users"}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
+    connection = mock_engine.return_value.begin.return_value.__enter__.return_value
+    cursor = connection.connection.cursor.return_value.__enter__.return_value
 
-    assert loader.get_table_info("users") is None
+    with patch.object(pd.DataFrame, "to_sql") as mock_to_sql:
+        assert loader.load_csv_direct(str(file_path)) is True
+
+    mock_to_sql.assert_called_once_with("users", connection, if_exists="replace", index=False)
+    sql, csv_file = cursor.copy_expert.call_args.args
+    assert sql == 'COPY "users" ("id", "name") FROM STDIN WITH CSV HEADER'
+    assert csv_file.name == str(file_path)
 
 
 @patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.inspect")
-def test_get_table_info_success(mock_inspect, mock_engine):
-    mock_inspector = mock_inspect.return_value
-    mock_inspector.has_table.return_value = True
-    mock_inspector.get_columns.return_value = [{"name": "id"}, {"name": "name"}]
+def test_load_csv_direct_types_columns_like_copy(mock_engine, tmp_path):
+    file_path = tmp_path / "users.csv"
+    file_path.write_text("id,score,rank\n1,NA,1.5\n2,3.5,\n")
 
-    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
+    dest = {"db_type": "postgresql", "connection": {"database": "d"}, "table": "users"}
+    loader = SQLDataFrameLoader(DummyLogger(), dest)
+
+    with patch.object(pd.DataFrame, "to_sql", autospec=True) as mock_to_sql:
+        assert loader.load_csv_direct(str(file_path)) is True
+
+    created = mock_to_sql.call_args.args[0]
+    assert created["score"].dtype == object
+    assert created["rank"].dtype == "float64"
+
+
+@patch("tool_service.src.load_sql.create_engine")
+def test_load_csv_direct_falls_back_for_other_databases(mock_engine):
+    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}, "table": "users"}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
+    with patch.object(loader, "load_csv_to_database", return_value=True) as mock_load:
+        assert loader.load_csv_direct("file.csv") is True
+
+    mock_load.assert_called_once_with("file.csv", None, None)
+
+
+# ---------- Table Inspection ----------
+
+def _sqlite_loader(tmp_path, **destination):
+    dest = {"db_type": "sqlite", "connection": {"database": str(tmp_path / "test.db")}, **destination}
+    return SQLDataFrameLoader(DummyLogger(), dest)
+
+
+def test_get_table_info_missing(tmp_path):
+    loader = _sqlite_loader(tmp_path)
+
+    assert loader.get_table_info("users") is None
+
+
+def test_get_table_info_success(tmp_path):
+    loader = _sqlite_loader(tmp_path)
+    pd.DataFrame({"id": [1], "name": ["a"]}).to_sql("users", loader.engine, index=False)
+
     result = loader.get_table_info("users")
+    assert result["columns"] == ["id", "name"]
     assert result["column_count"] == 2
 
 
+def test_get_table_info_is_cached_until_write(tmp_path):
+    loader = _sqlite_loader(tmp_path, table="users")
+    loader.load_dataframe_to_sql(pd.DataFrame({"id": [1]}))
+
+    with patch.object(loader._metadata, "reflect", wraps=loader._metadata.reflect) as mock_reflect:
+        loader.get_table_info("users")
+        loader.get_table_info("users")
+        mock_reflect.assert_called_once()
+
+        loader.load_dataframe_to_sql(pd.DataFrame({"id": [2]}), if_exists="append")
+        loader.get_table_info("users")
+        mock_reflect.assert_called_once()
+
+        loader.load_dataframe_to_sql(pd.DataFrame({"id": [3], "name": ["c"]}))
+        assert loader.get_table_info("users")["columns"] == ["id", "name"]
+        assert mock_reflect.call_count == 2
+
+
+def test_get_table_info_expires_after_ttl(tmp_path):
+    loader = _sqlite_loader(tmp_path)
+    pd.DataFrame({"id": [1]}).to_sql("users", loader.engine, index=False)
+    assert loader.get_table_info("users")["columns"] == ["id"]
+
+    pd.DataFrame({"id": [1], "name": ["a"]}).to_sql("users", loader.engine, index=False, if_exists="replace")
+    assert loader.get_table_info("users")["columns"] == ["id"]
+
+    with patch("tool_service.src.load_sql.SCHEMA_CACHE_TTL", 0):
+        assert loader.get_table_info("users")["columns"] == ["id", "name"]
+
+
+def test_write_invalidates_other_loaders_on_engine(tmp_path):
+    first = _sqlite_loader(tmp_path, table="t")
+    second = _sqlite_loader(tmp_path, table="t")
+    first.load_dataframe_to_sql(pd.DataFrame({"id": [1]}))
+    assert second.get_table_info("t")["columns"] == ["id"]
+
+    first.load_dataframe_to_sql(pd.DataFrame({"id": [1], "extra": [2]}))
+
+    assert second.get_table_info("t")["columns"] == ["id", "extra"]
+
+
+def test_streamed_append_uses_current_columns_after_other_loader_replaces(tmp_path):
+    first = _sqlite_loader(tmp_path, table="t")
+    second = _sqlite_loader(tmp_path, table="t")
+    second.stream_threshold = 0
+    first.load_dataframe_to_sql(pd.DataFrame({"id": [1]}))
+    second.load_dataframe_to_sql(pd.DataFrame({"id": [2]}), if_exists="append")
+
+    first.load_dataframe_to_sql(pd.DataFrame({"id": [3], "extra": [4]}))
+    result = second.load_dataframe_to_sql(pd.DataFrame({"id": [5], "extra": [6]}), if_exists="append")
+
+    assert result["success"] is True
+    assert pd.read_sql("SELECT extra FROM t", first.engine)["extra"].tolist() == [4, 6]
+
+
+def test_fast_insert_reflects_table_once_per_load(tmp_path):
+    loader = _sqlite_loader(tmp_path, table="users")
+    loader.stream_threshold = 0
+    frames = [pd.DataFrame({"id": [1, 2]}), pd.DataFrame({"id": [3]}), pd.DataFrame({"id": [4]})]
+
+    with patch("tool_service.src.load_sql.Table", wraps=Table) as mock_table:
+        result = loader._load_frames(iter(frames), "users", "replace")
+
+    assert result["rows_loaded"] == 4
+    mock_table.assert_called_once()
+
+
+def test_streamed_append_recreates_table_dropped_elsewhere(tmp_path):
+    loader = _sqlite_loader(tmp_path, table="users")
+    loader.stream_threshold = 0
+    loader.load_dataframe_to_sql(pd.DataFrame({"id": [1]}))
+
+    with loader.engine.begin() as connection:
+        connection.execute(text("DROP TABLE users"))
+    result = loader.load_dataframe_to_sql(pd.DataFrame({"id": [2]}), if_exists="append")
+
+    assert result["success"] is True
+    with loader.engine.connect() as connection:
+        assert connection.execute(text("SELECT id FROM users")).scalars().all() == [2]
+
+
+@patch("tool_service.src.load_sql.create_engine")
+@patch("tool_service.src.load_sql.inspect")
+def test_inspector_is_shared_across_loaders(mock_inspect, mock_engine):
+    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
+    first = SQLDataFrameLoader(DummyLogger(), dest)
+    second = SQLDataFrameLoader(DummyLogger(), dest)
+
+    assert first.inspector is second.inspector
+    mock_inspect.assert_called_once()
+
+
 @patch("tool_service.src.load_sql.create_engine")
 @patch("tool_service.src.load_sql.inspect")
 def test_list_tables(mock_inspect, mock_engine):
@@ -231,13 +675,31 @@ def test_list_tables(mock_inspect, mock_engine):
     assert loader.list_tables() == ["users", "orders"]
 
 
+def test_list_tables_expires_after_ttl(tmp_path):
+    loader = _sqlite_loader(tmp_path)
+    with loader.engine.begin() as connection:
+        connection.execute(text("CREATE TABLE t (id INTEGER)"))
+    assert loader.list_tables() == ["t"]
+
+    with loader.engine.begin() as connection:
+        connection.execute(text("DROP TABLE t"))
+        connection.execute(text("CREATE TABLE z (id INTEGER)"))
+    assert loader.list_tables() == ["t"]
+
+    with patch("tool_service.src.load_sql.SCHEMA_CACHE_TTL", 0):
+        assert loader.list_tables() == ["z"]
+
+
 @patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.inspect", side_effect=Exception("inspect error"))
+@patch("tool_service.src.load_sql.inspect")
 def test_list_tables_exception(mock_inspect, mock_engine):
+    mock_inspect.return_value.get_table_names.side_effect = SQLAlchemyError("inspect error")
+
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
-    assert loader.list_tables() == []
+    with pytest.raises(SQLAlchemyError):
+        loader.list_tables()
 
 
 # ---------- Close Connection ----------
@@ -249,43 +711,39 @@ def test_close_connection(mock_engine):
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
+    loader.engine
     loader.close()
     mock_engine.return_value.dispose.assert_called_once()
 
 
 @patch("tool_service.src.load_sql.create_engine")
-def test_close_connection_exception(mock_engine):
-    mock_engine.return_value.dispose.side_effect = Exception("close error")
-
+def test_close_without_engine_use(mock_engine):
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
-    loader.close()  # should not raise
-    
+    loader.close()
+    mock_engine.assert_not_called()
+
+
 @patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.inspect")
-def test_get_table_info_success(mock_inspect, mock_engine):
-    mock_inspector = mock_inspect.return_value
-    mock_inspector.has_table.return_value = True
-    mock_inspector.get_columns.return_value = [{"name": "id"}, {"name": "name"}]
+def test_close_connection_exception(mock_engine):
+    mock_engine.return_value.dispose.side_effect = Exception("close error")
 
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
 
-    result = loader.get_table_info("users")
-    assert result["column_count"] == 2
+    loader.engine
+    loader.close()  # should not raise
     
-@patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.inspect", side_effect=Exception("inspect fail"))
-def test_get_table_info_exception(mock_inspect, mock_engine):
-    dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
-    loader = SQLDataFrameLoader(DummyLogger(), dest)
+def test_get_table_info_exception(tmp_path):
+    loader = _sqlite_loader(tmp_path)
 
-    result = loader.get_table_info("users")
+    with patch.object(loader._metadata, "reflect", side_effect=SQLAlchemyError("inspect fail")):
+        result = loader.get_table_info("users")
     assert result is None
     
 @patch("tool_service.src.load_sql.create_engine")
-@patch("tool_service.src.load_sql.pd.read_csv", side_effect=Exception("unknown error"))
+@patch("pandas.read_csv", side_effect=Exception("unknown error"))
 def test_load_csv_unexpected_exception(mock_read, mock_engine):
     dest = {"db_type": "sqlite", "connection": {"database": "test.db"}}
     loader = SQLDataFrameLoader(DummyLogger(), dest)
@@ -0,0 +1,126 @@
+import logging
+import threading
+from logging.handlers import QueueHandler
+
+from tool_service.util import logger as logger_module
+from tool_service.util.logger import (
+    MemoryHandler,
+    _memory_handler,
+    clear_logs,
+    flush_logs,
+    get_logger,
+    save_logs_to_file,
+)
+
+
+def _record(message, level=logging.INFO):
+    return logging.LogRecord("test", level, __file__, 1, message, None, None)
+
+
+def test_memory_handler_keeps_most_recent_records():
+    handler = MemoryHandler(capacity=3)
+
+    for number in range(5):
+        handler.handle(_record(f"line {number}"))
+
+    assert handler.get_logs() == ["line 2", "line 3", "line 4"]
+
+
+def test_memory_handler_default_capacity():
+    assert MemoryHandler().records.maxlen == logger_module.MAX_MEMORY_RECORDS == 10_000
+
+
+def test_memory_handler_filters_below_info():
+    handler = MemoryHandler()
+    log = logging.getLogger("tests.logger.level")
+    log.setLevel(logging.DEBUG)
+    log.propagate = False
+    log.addHandler(handler)
+
+    log.debug("debug")
+    log.info("info")
+
+    assert handler.get_logs() == ["info"]
+
+
+def test_memory_handler_formats_lazily():
+    handler = MemoryHandler()
+    handler.handle(logging.LogRecord("test", logging.INFO, __file__, 1, "rows: %d", (3,), None))
+
+    handler.setFormatter(logging.Formatter("%(levelname)s %(message)s"))
+
+    assert handler.get_logs() == ["INFO rows: 3"]
+
+
+def test_get_logger_only_enqueues_records():
+    log = get_logger("tests.logger.enqueue")
+
+    assert [type(handler) for handler in log.handlers] == [QueueHandler]
+
+
+def test_listener_writes_records_on_background_thread():
+    clear_logs()
+    threads = []
+    original_emit = _memory_handler.emit
+
+    def emit(record):
+        threads.append(threading.current_thread())
+        original_emit(record)
+
+    _memory_handler.emit = emit
+    try:
+        get_logger("tests.logger.thread").info("from caller")
+        flush_logs()
+    finally:
+        del _memory_handler.emit
+
+    assert threads and threading.current_thread() not in threads
+    assert _memory_handler.get_logs()[-1].endswith("| tests.logger.thread | from caller")
+
+
+def test_flush_logs_restarts_listener():
+    clear_logs()
+    log = get_logger("tests.logger.flush")
+
+    log.info("first")
+    flush_logs()
+    log.info("second")
+    flush_logs()
+
+    assert [line.rsplit("| ", 1)[-1] for line in _memory_handler.get_logs()] == ["first", "second"]
+
+
+def test_save_logs_to_file_clears_saved_logs(tmp_path):
+    clear_logs()
+    log_file = tmp_path / "logs" / "app.log"
+    log = get_logger("tests.logger.save")
+
+    log.info("saved once")
+    save_logs_to_file(str(log_file))
+    save_logs_to_file(str(log_file))
+
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert len(lines) == 1 and lines[0].endswith("saved once")
+    assert _memory_handler.get_logs() == []
+
+
+def test_concurrent_flushes_keep_one_listener(tmp_path):
+    errors = []
+
+    def save(number):
+        try:
+            get_logger("tests.logger.concurrent").info("from thread %d", number)
+            save_logs_to_file(str(tmp_path / "app.log"))
+            clear_logs()
+        except Exception as e:
+            errors.append(e)
+
+    workers = [threading.Thread(target=save, args=(number,)) for number in range(8)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
+
+    listeners = [thread for thread in threading.enumerate() if thread.name.endswith("(_monitor)")]
+    assert errors == []
+    assert listeners == [logger_module._listener._thread]
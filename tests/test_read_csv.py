@@ -1,7 +1,10 @@
+import os
+
 import pandas as pd
+import pytest
 from tool_service.src.read_csv import CSVLoader
 from unittest.mock import patch
-from tool_service.src.read_csv import CSVLoader
+from tool_service.src.read_csv import CSVLoader, read_csv_arrow
 
 
 def test_load_csv_success(tmp_path):
@@ -22,6 +25,16 @@ def test_load_csv_success(tmp_path):
     assert list(result.columns) == ["name", "age"]
 
 
+def test_load_csv_in_chunks(tmp_path):
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"id": range(5)}).to_csv(file_path, index=False)
+
+    loader = CSVLoader()
+    chunks = list(loader.load_csv(str(file_path), chunksize=2))
+
+    assert [len(chunk) for chunk in chunks] == [2, 2, 1]
+
+
 def test_load_csv_file_not_found():
     loader = CSVLoader()
     result = loader.load_csv("missing_file.csv")
@@ -32,7 +45,8 @@ def test_load_csv_file_not_found():
     
 
 
-@patch("tool_service.src.read_csv.pd.read_csv")
+@patch("tool_service.src.read_csv.PYARROW_AVAILABLE", False)
+@patch("pandas.read_csv")
 def test_load_csv_generic_exception(mock_read_csv):
     mock_read_csv.side_effect = Exception("Unexpected failure")
 
@@ -41,4 +55,174 @@ def test_load_csv_generic_exception(mock_read_csv):
 
     assert isinstance(result, dict)
     assert result["status"] == "failed"
-    assert "Unexpected failure" in result["error"]
\ No newline at end of file
+    assert "Unexpected failure" in result["error"]
+
+@patch("tool_service.src.read_csv.PYARROW_AVAILABLE", False)
+def test_load_csv_without_pyarrow(tmp_path):
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"id": [1, 2]}).to_csv(file_path, index=False)
+
+    result = CSVLoader().load_csv(str(file_path))
+
+    assert result["id"].tolist() == [1, 2]
+
+
+def test_load_csv_reads_repetitive_strings_as_category(tmp_path):
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({
+        "status": ["open", "closed", "open", "open"],
+        "note": ["a", "b", "c", "d"]
+    }).to_csv(file_path, index=False)
+
+    result = CSVLoader().load_csv(str(file_path))
+
+    assert result["status"].dtype == "category"
+    assert result["note"].dtype != "category"
+
+
+@patch("tool_service.src.read_csv.PYARROW_AVAILABLE", False)
+def test_load_csv_uses_supplied_dtypes(tmp_path):
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"id": [1, 2]}).to_csv(file_path, index=False)
+
+    result = CSVLoader().load_csv(str(file_path), dtypes={"id": "float64"})
+
+    assert result["id"].dtype == "float64"
+
+
+def test_loaders_share_module_logger():
+    assert CSVLoader().logger is CSVLoader().logger
+
+
+def test_read_csv_arrow(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"id": [1, 2], "name": ["a", "b"]}).to_csv(file_path, index=False)
+
+    table = read_csv_arrow(str(file_path))
+
+    assert table.num_rows == 2
+    assert table.column_names == ["id", "name"]
+
+
+def test_load_csv_reuses_feather_cache(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"id": [1, 2], "status": ["a", "a"]}).to_csv(file_path, index=False)
+    loader = CSVLoader(cache_dir=str(tmp_path / "cache"))
+
+    first = loader.load_csv(str(file_path))
+    with patch("tool_service.src.read_csv.read_csv_arrow") as mock_read:
+        second = loader.load_csv(str(file_path))
+
+    mock_read.assert_not_called()
+    assert second["id"].tolist() == first["id"].tolist() == [1, 2]
+    assert second["status"].dtype == "category"
+
+
+def test_load_csv_refreshes_stale_cache(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"id": [1, 2]}).to_csv(file_path, index=False)
+    loader = CSVLoader(cache_dir=str(tmp_path / "cache"))
+    loader.load_csv(str(file_path))
+
+    pd.DataFrame({"id": [1, 2, 3]}).to_csv(file_path, index=False)
+
+    assert loader.load_csv(str(file_path))["id"].tolist() == [1, 2, 3]
+
+
+def test_refreshed_cache_leaves_earlier_frames_readable(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"a": range(1000)}).to_csv(file_path, index=False)
+    loader = CSVLoader(cache_dir=str(tmp_path / "cache"))
+    loader.load_csv(str(file_path))
+    mapped = loader.load_csv(str(file_path))
+
+    pd.DataFrame({"a": range(10)}).to_csv(file_path, index=False)
+    refreshed = loader.load_csv(str(file_path))
+
+    assert mapped["a"].sum() == sum(range(1000))
+    assert refreshed["a"].tolist() == list(range(10))
+    assert os.listdir(tmp_path / "cache") == [os.path.basename(loader._cache_path(str(file_path)))]
+
+
+def test_load_csv_rewrites_corrupt_cache(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"id": [1, 2]}).to_csv(file_path, index=False)
+    loader = CSVLoader(cache_dir=str(tmp_path / "cache"))
+    cache_path = loader._cache_path(str(file_path))
+    (tmp_path / "cache").mkdir()
+    with open(cache_path, "wb") as cache_file:
+        cache_file.write(b"not a feather file")
+
+    assert loader.load_csv(str(file_path))["id"].tolist() == [1, 2]
+    assert loader._read_cache(cache_path, str(file_path))["id"].tolist() == [1, 2]
+
+
+def test_open_csv_stream(tmp_path):
+    pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    pd.DataFrame({"id": [1, 2, 3]}).to_csv(file_path, index=False)
+
+    reader = CSVLoader().open_csv_stream(str(file_path))
+
+    assert reader.read_all().column("id").to_pylist() == [1, 2, 3]
+
+
+def test_load_csv_with_arrow_schema(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    file_path.write_text("id,city\n1,a\n2,\n3,a\n")
+    schema = pa.schema([("id", pa.int16())])
+
+    with patch.object(CSVLoader, "_infer_dtypes") as mock_infer:
+        df = CSVLoader().load_csv(str(file_path), schema=schema)
+
+    mock_infer.assert_not_called()
+    assert df["id"].dtype == pd.ArrowDtype(pa.int16())
+    assert df["city"].dtype == "category"
+    assert df["city"].isna().tolist() == [False, True, False]
+
+
+def test_load_csv_chunks_with_arrow_schema(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    file_path.write_text("id\n1\n2\n3\n")
+
+    chunks = list(CSVLoader().load_csv(str(file_path), chunksize=2, schema=pa.schema([("id", pa.int16())])))
+
+    assert [len(chunk) for chunk in chunks] == [2, 1]
+    assert chunks[0]["id"].dtype == pd.ArrowDtype(pa.int16())
+
+
+def test_load_csv_reads_empty_text_cells_as_na(tmp_path):
+    file_path = tmp_path / "sample.csv"
+    file_path.write_text("id,name\n1,a\n2,\n3,NULL\n")
+
+    df = CSVLoader().load_csv(str(file_path))
+
+    assert df["name"].isna().tolist() == [False, True, True]
+
+
+@patch("tool_service.src.read_csv.PYARROW_AVAILABLE", False)
+def test_load_csv_reads_empty_text_cells_as_na_without_pyarrow(tmp_path):
+    file_path = tmp_path / "sample.csv"
+    file_path.write_text("id,name\n1,a\n2,\n3,NULL\n")
+
+    df = CSVLoader().load_csv(str(file_path))
+
+    assert df["name"].isna().tolist() == [False, True, True]
+
+
+def test_infer_dtypes_leaves_repeated_dates_to_the_reader(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    file_path = tmp_path / "sample.csv"
+    file_path.write_text("day,city\n2024-01-01,a\n2024-01-01,a\n2024-01-02,b\n2024-01-01,a\n")
+
+    df = CSVLoader().load_csv(str(file_path))
+
+    assert df["day"].dtype == pd.ArrowDtype(pa.date32())
+    assert df["city"].dtype == "category"
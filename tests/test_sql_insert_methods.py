@@ -0,0 +1,16 @@
+from unittest.mock import MagicMock
+
+from tool_service.src.sql_insert_methods import psql_insert_copy
+
+
+def test_psql_insert_copy_streams_csv():
+    pd_table = MagicMock(schema=None)
+    pd_table.name = "users"
+    conn = MagicMock()
+    cursor = conn.connection.cursor.return_value.__enter__.return_value
+
+    psql_insert_copy(pd_table, conn, ["id", "name"], iter([(1, "a"), (2, None)]))
+
+    sql, buffer = cursor.copy_expert.call_args.args
+    assert sql == 'COPY "users" ("id", "name") FROM STDIN WITH CSV'
+    assert buffer.getvalue().splitlines() == ["1,a", "2,"]
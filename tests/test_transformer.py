@@ -1,4 +1,5 @@
 from unittest.mock import patch, MagicMock
+from sqlalchemy.exc import SQLAlchemyError
 from tool_service.transformer import DataTransformer
 
 
@@ -13,7 +14,7 @@ def test_transform_data_success(mock_csv_loader, mock_sdfl):
     # Mock DB loader
     mock_loader_instance = mock_sdfl.return_value
     mock_loader_instance.test_connection.return_value = {"success": True}
-    mock_loader_instance.load_dataframe_to_sql.return_value = True
+    mock_loader_instance.load_dataframe_to_sql.return_value = {"success": True}
 
     transformer = DataTransformer()
 
@@ -22,9 +23,173 @@ def test_transform_data_success(mock_csv_loader, mock_sdfl):
 
     result = transformer.transform_data(source, destination)
 
-    assert result is True
-    mock_loader_instance.test_connection.assert_called_once()
-    mock_loader_instance.load_dataframe_to_sql.assert_called_once_with("fake_dataframe", "users")
+    assert result == {"success": True}
+    conn = mock_loader_instance.engine.begin.return_value.__enter__.return_value
+    mock_loader_instance.test_connection.assert_not_called()
+    mock_loader_instance.load_dataframe_to_sql.assert_called_once_with(
+        "fake_dataframe", "users", connection=conn
+    )
+    conn.rollback.assert_not_called()
+
+
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_verifies_connection_when_requested(mock_csv_loader, mock_sdfl):
+    mock_csv_loader.return_value.load_csv.return_value = "fake_dataframe"
+
+    mock_loader_instance = mock_sdfl.return_value
+    mock_loader_instance.test_connection.return_value = {"success": True}
+    mock_loader_instance.load_dataframe_to_sql.return_value = {"success": True}
+
+    destination = {"table": "users", "verify_connection": True}
+    result = DataTransformer().transform_data({"path": "file.csv"}, destination)
+
+    assert result == {"success": True}
+    conn = mock_loader_instance.engine.begin.return_value.__enter__.return_value
+    mock_loader_instance.test_connection.assert_called_once_with(conn)
+
+
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_load_failure_rolls_back(mock_csv_loader, mock_sdfl):
+    mock_csv_loader.return_value.load_csv.return_value = "fake_dataframe"
+
+    mock_loader_instance = mock_sdfl.return_value
+    mock_loader_instance.test_connection.return_value = {"success": True}
+    mock_loader_instance.load_dataframe_to_sql.return_value = {"success": False}
+
+    result = DataTransformer().transform_data({"path": "file.csv"}, {"table": "users"})
+
+    assert result == {"success": False}
+    conn = mock_loader_instance.engine.begin.return_value.__enter__.return_value
+    conn.rollback.assert_called_once()
+
+
+# ---------- Loader Reuse ----------
+
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_reuses_loaders(mock_csv_loader, mock_sdfl):
+    mock_sdfl.return_value.test_connection.return_value = {"success": True}
+
+    transformer = DataTransformer()
+
+    destination = {"table": "users", "connection": {"host": "h", "database": "d"}}
+    transformer.transform_data({"path": "a.csv"}, destination)
+    transformer.transform_data({"path": "b.csv"}, dict(destination))
+    transformer.transform_data({"path": "c.csv"}, {"table": "users", "connection": {"host": "other"}})
+
+    mock_csv_loader.assert_called_once()
+    assert mock_sdfl.call_count == 2
+
+
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_accepts_list_values_in_destination(mock_csv_loader, mock_sdfl):
+    mock_sdfl.return_value.load_dataframe_to_sql.return_value = {"success": True}
+
+    transformer = DataTransformer()
+    destination = {"table": "users", "columns": ["id"], "connection": {"hosts": ["a", "b"]}}
+
+    assert transformer.transform_data({"path": "a.csv"}, destination) == {"success": True}
+    transformer.transform_data({"path": "b.csv"}, {**destination, "columns": ["id", "name"]})
+    mock_sdfl.assert_called_once()
+
+
+@patch("tool_service.transformer.MAX_SQL_LOADERS", 2)
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_sql_loader_cache_is_bounded(mock_csv_loader, mock_sdfl):
+    transformer = DataTransformer()
+
+    for table in ("a", "b", "a", "c"):
+        transformer._get_sql_loader({"table": table})
+
+    assert [key[3] for key in transformer._sql_loaders] == ["a", "c"]
+
+
+# ---------- Arrow Streaming Path ----------
+
+@patch("tool_service.transformer.PYARROW_AVAILABLE", True)
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_streams_arrow_to_adbc(mock_csv_loader, mock_sdfl):
+    reader = mock_csv_loader.return_value.open_csv_stream.return_value
+
+    mock_loader_instance = mock_sdfl.return_value
+    mock_loader_instance.test_connection.return_value = {"success": True}
+    mock_loader_instance.load_arrow_stream_to_sql.return_value = {"success": True}
+
+    transformer = DataTransformer()
+
+    source = {"path": "file.csv"}
+    destination = {"table": "users", "db_type": "postgresql_adbc"}
+
+    result = transformer.transform_data(source, destination)
+
+    assert result == {"success": True}
+    mock_loader_instance.load_arrow_stream_to_sql.assert_called_once_with(reader, "users")
+    reader.close.assert_called_once()
+    mock_csv_loader.return_value.load_csv.assert_not_called()
+    mock_loader_instance.load_dataframe_to_sql.assert_not_called()
+
+
+@patch("tool_service.transformer.PYARROW_AVAILABLE", True)
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_matches_adbc_db_type_case_insensitively(mock_csv_loader, mock_sdfl):
+    destination = {"table": "users", "db_type": "POSTGRESQL_ADBC"}
+    DataTransformer().transform_data({"path": "file.csv"}, destination)
+
+    mock_sdfl.return_value.load_arrow_stream_to_sql.assert_called_once()
+    mock_sdfl.return_value.load_dataframe_to_sql.assert_not_called()
+
+
+@patch("tool_service.transformer.PYARROW_AVAILABLE", True)
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_stream_open_failure_returns_failure(mock_csv_loader, mock_sdfl):
+    mock_csv_loader.return_value.open_csv_stream.side_effect = FileNotFoundError("missing.csv")
+
+    destination = {"table": "users", "db_type": "postgresql_adbc"}
+    result = DataTransformer().transform_data({"path": "missing.csv"}, destination)
+
+    assert result["success"] is False
+    assert result["table"] == "users"
+    assert result["rows_loaded"] == 0
+    assert "missing.csv" in result["message"]
+    mock_sdfl.return_value.load_arrow_stream_to_sql.assert_not_called()
+
+
+@patch("tool_service.transformer.PYARROW_AVAILABLE", True)
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_stream_verifies_connection_when_requested(mock_csv_loader, mock_sdfl):
+    mock_sdfl.return_value.test_connection.return_value = {"success": False, "message": "down"}
+
+    destination = {"table": "users", "db_type": "postgresql_adbc", "verify_connection": True}
+    result = DataTransformer().transform_data({"path": "file.csv"}, destination)
+
+    assert result == {"success": False, "message": "down"}
+    mock_sdfl.return_value.test_connection.assert_called_once_with(None)
+    mock_csv_loader.return_value.open_csv_stream.assert_not_called()
+    mock_sdfl.return_value.load_arrow_stream_to_sql.assert_not_called()
+
+
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_csv_read_failure_returns_failure(mock_csv_loader, mock_sdfl):
+    mock_csv_loader.return_value.load_csv.return_value = {
+        "status": "failed", "error": "File not found: missing.csv"
+    }
+
+    result = DataTransformer().transform_data({"path": "missing.csv"}, {"table": "users"})
+
+    assert result == {
+        "success": False, "table": "users", "rows_loaded": 0, "message": "File not found: missing.csv"
+    }
+    mock_sdfl.return_value.engine.begin.assert_not_called()
+    mock_sdfl.return_value.load_dataframe_to_sql.assert_not_called()
 
 
 # ---------- Connection Failure Path ----------
@@ -43,7 +208,7 @@ def test_transform_data_connection_failure(mock_csv_loader, mock_sdfl):
     transformer = DataTransformer()
 
     source = {"path": "file.csv"}
-    destination = {"table": "users"}
+    destination = {"table": "users", "verify_connection": True}
 
     result = transformer.transform_data(source, destination)
 
@@ -52,6 +217,19 @@ def test_transform_data_connection_failure(mock_csv_loader, mock_sdfl):
     mock_loader_instance.load_dataframe_to_sql.assert_not_called()
 
 
+@patch("tool_service.transformer.SDFL")
+@patch("tool_service.transformer.CSVLoader")
+def test_transform_data_connection_error_returns_failure(mock_csv_loader, mock_sdfl):
+    mock_csv_loader.return_value.load_csv.return_value = "fake_dataframe"
+    mock_sdfl.return_value.engine.begin.side_effect = SQLAlchemyError("unreachable")
+
+    result = DataTransformer().transform_data({"path": "file.csv"}, {"table": "users"})
+
+    assert result["success"] is False
+    assert result["table"] == "users"
+    assert "unreachable" in result["message"]
+
+
 # ---------- CSV Load Failure Propagates ----------
 
 @patch("tool_service.transformer.CSVLoader")
@@ -1,4 +1,4 @@
-from tool_service.transformer import DataTransformer as DT
+from tool_service.transformer import get_transformer
 from tool_service.util.logger import get_logger
 
 logger = get_logger(__name__)
@@ -7,6 +7,7 @@ logger = get_logger(__name__)
 class ConnectionHandler:
     def __init__(self):
         self.logger = logger
+        self.transformer = get_transformer()
 
     def handle_request(self, request: dict) -> dict:
         """Handle incoming request with source and destination configuration."""
@@ -19,7 +20,7 @@ class ConnectionHandler:
         self._log_request_details(environment, source, destination)
 
         try:
-            result = DT().transform_data(source, destination)
+            result = self.transformer.transform_data(source, destination)
             return self._success_response(environment, result)
         except Exception as e:
             self.logger.error("Error in connection layer", exc_info=True)
@@ -27,9 +28,9 @@ class ConnectionHandler:
 
     def _log_request_details(self, environment: str, source: dict, destination: dict) -> None:
         """Log request details for debugging."""
-        self.logger.info(f"Environment: {environment}")
-        self.logger.info(f"Source type: {source.get('type')}")
-        self.logger.info(f"Destination type: {destination.get('type')}")
+        self.logger.info("Environment: %s", environment)
+        self.logger.info("Source type: %s", source.get("type"))
+        self.logger.info("Destination type: %s", destination.get("type"))
 
     def _success_response(self, environment: str, result: dict) -> dict:
         """Build success response."""
@@ -1,107 +1,325 @@
 """Module for loading dataframes to local SQL database."""
 
-import pandas as pd
-from sqlalchemy import create_engine, inspect, text
-from sqlalchemy.exc import SQLAlchemyError
-from typing import Optional, Dict, Any
+from __future__ import annotations
+
+import functools
+import time
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
+from sqlalchemy import MetaData, Table, create_engine, inspect, text
+from sqlalchemy.exc import InvalidRequestError, SQLAlchemyError
+from sqlalchemy.pool import StaticPool
+from typing import TYPE_CHECKING, Optional, Dict, Any
 from urllib.parse import quote_plus
-import sys
-import os
 
-# Add parent directories to path
-sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+from tool_service.util.logger import get_logger
+from tool_service.src.sql_insert_methods import psql_insert_copy
+
+if TYPE_CHECKING:
+    # pandas is imported where it is used, so connection checks and ADBC
+    # stream loads never pay its import cost
+    import pandas as pd
+
+# SQL Server rejects statements with more than 2100 bound parameters
+MSSQL_MAX_PARAMS = 2100
+
+# Default DataFrame.to_sql insert method per database type:
+# COPY for PostgreSQL, multi-row VALUES for SQL Server, executemany for SQLite
+DEFAULT_INSERT_METHODS = {
+    "postgresql": psql_insert_copy,
+    "postgresql_adbc": psql_insert_copy,
+    "mssql": "multi",
+    "sqlite": None,
+}
+
+# ADBC ingest mode for each to_sql if_exists behavior
+ADBC_INGEST_MODES = {
+    "fail": "create",
+    "replace": "replace",
+    "append": "create_append",
+}
+
+# Rows per executemany batch when streaming large DataFrames
+STREAM_CHUNK_SIZE = 10_000
+
+# Rows sampled to create the target table before a direct COPY load
+COPY_SCHEMA_SAMPLE_ROWS = 10_000
+
+# Upper bound on parallel insert workers; stays below the engine's pool_size
+MAX_INSERT_WORKERS = 8
+
+# String columns with at most this share of distinct values are downcast to categories
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+
+# Seconds cached table names and columns are trusted before the catalog is read again
+SCHEMA_CACHE_TTL = 60
+
+
+def _is_sqlite_memory(connection_string: str) -> bool:
+    """Whether a SQLite URL names an in-memory database rather than a file."""
+    database = connection_string.split("://", 1)[-1].lstrip("/")
+    return database in ("", ":memory:") or database.startswith(":memory:?") or "mode=memory" in database
+
 
-from util.logger import get_logger
+def _engine_options(connection_string: str) -> Dict[str, Any]:
+    """Build create_engine keyword arguments for connection pooling."""
+    if connection_string.startswith("sqlite"):
+        if _is_sqlite_memory(connection_string):
+            # An in-memory database lives only as long as its one connection
+            return {
+                "poolclass": StaticPool,
+                "connect_args": {"check_same_thread": False},
+            }
+        # File databases keep SQLAlchemy's default pool, so concurrent
+        # transforms get separate connections and transactions
+        return {}
+    
+    options = {
+        "pool_size": 10,
+        "max_overflow": 20,
+        "pool_timeout": 30,
+        "pool_recycle": 3600,
+        "pool_pre_ping": True,
+    }
+    if connection_string.startswith("mssql+pyodbc"):
+        # Send executemany batches as a single round trip instead of one per row
+        options["fast_executemany"] = True
+    return options
+
+
+def _sqlite_url(conn: Dict[str, Any], database_name: str) -> str:
+    """SQLite URL for the database file in conn, or <database_name>.db."""
+    db_file = conn.get("database") or f"{database_name}.db"
+    return f"sqlite:///{db_file}"
+
+
+def _postgresql_url(conn: Dict[str, Any], database_name: str) -> str:
+    """PostgreSQL URL for the default psycopg2 driver."""
+    user = conn.get("user", "postgres")
+    password = conn.get("password", "")
+    host = conn.get("host", "localhost")
+    port = conn.get("port", 5432)
+    database = conn.get("database", database_name)
+    
+    if password:
+        return f"postgresql://{user}:{password}@{host}:{port}/{database}"
+    return f"postgresql://{user}@{host}:{port}/{database}"
+
+
+def _mssql_url(conn: Dict[str, Any], database_name: str) -> str:
+    """SQL Server URL using pymssql, or pyodbc when conn sets driver='pyodbc'."""
+    user = conn.get("user", "root")
+    password = conn.get("password", "")
+    host = conn.get("host", "localhost")
+    port = conn.get("port", 1433)
+    database = conn.get("database", database_name)
+    
+    # URL-encode credentials to safely include special characters (e.g. '@')
+    user_enc = quote_plus(user) if user else ""
+    credentials = f"{user_enc}:{quote_plus(password)}" if password else user_enc
+    
+    if conn.get("driver", "pymssql") == "pyodbc":
+        # pyodbc needs an installed ODBC driver but supports fast_executemany:
+        #   mssql+pyodbc://<user>:<password>@<host>:<port>/<database>?driver=<odbc driver>
+        odbc_driver = quote_plus(conn.get("odbc_driver", "ODBC Driver 18 for SQL Server"))
+        return f"mssql+pyodbc://{credentials}@{host}:{port}/{database}?driver={odbc_driver}"
+    
+    # Default to the pymssql driver for SQL Server to avoid requiring ODBC drivers
+    # SQLAlchemy connection string for pymssql:
+    #   mssql+pymssql://<user>:<password>@<host>:<port>/<database>
+    return f"mssql+pymssql://{credentials}@{host}:{port}/{database}"
+
+
+# Connection URL builder per (lower-cased) db_type
+_DB_BUILDERS = {
+    "sqlite": _sqlite_url,
+    "postgresql": _postgresql_url,
+    "postgresql_adbc": _postgresql_url,
+    "mssql": _mssql_url,
+}
+
+
+@functools.lru_cache(maxsize=32)
+def _get_engine(connection_string: str):
+    """
+    Return a pooled engine for the connection string, reusing it across loaders.
+    
+    Creating an engine resolves the dialect and builds a new pool, so loaders
+    created per request share one engine per database instead.
+    """
+    return create_engine(connection_string, **_engine_options(connection_string))
+
+
+class _SchemaCache:
+    """
+    Schema inspector shared by every loader using one engine.
+    
+    The inspector keeps a reflection cache, so sharing it lets table lookups
+    made by one request serve the next. The cache is cleared by writes through
+    any loader and expires after SCHEMA_CACHE_TTL, so tables created or dropped
+    by other processes show up. ``changed_at`` records the last write that may
+    have changed a table's columns; loaders drop tables reflected before it.
+    """
+    
+    def __init__(self, engine):
+        self.engine = engine
+        self.refreshed_at = time.monotonic()
+        self.changed_at = 0.0
+    
+    @functools.cached_property
+    def inspector(self):
+        """Inspector for the engine, created on first use."""
+        return inspect(self.engine)
+    
+    def expire_if_stale(self) -> None:
+        """Clear the inspector's reflection cache once it is older than SCHEMA_CACHE_TTL."""
+        if time.monotonic() - self.refreshed_at >= SCHEMA_CACHE_TTL:
+            self.clear()
+    
+    def clear(self, schema_changed: bool = False) -> None:
+        """Clear the inspector's reflection cache, marking reflected tables stale if the schema changed."""
+        if "inspector" in self.__dict__:
+            self.inspector.clear_cache()
+        self.refreshed_at = time.monotonic()
+        if schema_changed:
+            self.changed_at = self.refreshed_at
+
+
+@functools.lru_cache(maxsize=32)
+def _get_schema_cache(engine) -> _SchemaCache:
+    """Return the schema cache shared by every loader using the engine."""
+    return _SchemaCache(engine)
 
 
 class SQLDataFrameLoader:
     """Class to load pandas DataFrames to a local SQL database."""
     
-    def __init__(self, logger, destination: Dict[str, Any]):
+    def __init__(
+        self,
+        logger,
+        destination: Dict[str, Any],
+        method: Optional[str] = None,
+        chunk_size: Optional[int] = 1000,
+        stream_threshold: Optional[int] = 100_000,
+        max_workers: int = 1
+    ):
         """
         Initialize the SQLDataFrameLoader.
         
         Args:
             logger: Logger instance for logging operations
             destination: Destination configuration dict with:
-                - db_type: Type of database (sqlite, postgresql, mysql)
+                - db_type: Type of database (sqlite, postgresql, postgresql_adbc, mssql);
+                  postgresql_adbc bulk loads through ADBC and uses psycopg2 for everything else
                 - database_name: Name of the database (optional)
                 - connection: Dict with host, port, user, password, database
+                  (for mssql, driver='pyodbc' and odbc_driver select pyodbc over pymssql)
                 - table: Table name (optional, can be provided during load)
                 - if_exists: How to behave if table exists ('fail', 'replace', 'append')
+            method: Insert method passed to DataFrame.to_sql ('multi' packs many
+                    rows into one INSERT); None picks the default for the
+                    database type from DEFAULT_INSERT_METHODS
+            chunk_size: Default number of rows per INSERT batch
+            stream_threshold: Row count above which DataFrames are inserted chunk by
+                              chunk instead of through to_sql (None disables streaming)
+            max_workers: Number of threads inserting streamed chunks in parallel
+                         (capped at 8; SQLite always inserts serially)
         """
         self.logger = logger
         self.destination = destination
         self.db_type = destination.get("db_type", "")
         self.database_name = destination.get("database_name", "")
         self.connection_details = destination.get("connection", {})
-        self.engine = None
-        self._initialize_engine()
+        self.method = method
+        self.chunk_size = chunk_size
+        self.stream_threshold = stream_threshold
+        self.max_workers = max_workers
+        self._schema_cache = None
+        # Tables reflected by this loader, reused until a write may change them
+        # or SCHEMA_CACHE_TTL expires
+        self._metadata = MetaData()
+        self._metadata_loaded_at = time.monotonic()
+        # Validate the destination up front; the engine itself is created on first use
+        try:
+            self._build_url = _DB_BUILDERS[self.db_type.lower()]
+        except KeyError:
+            raise ValueError(f"Unsupported database type: {self.db_type}") from None
+        self._connection_string = self._build_connection_string()
     
     def _build_connection_string(self) -> str:
         """Build connection string based on database type and connection details."""
-        conn = self.connection_details
+        return self._build_url(self.connection_details, self.database_name)
+    
+    def _uses_adbc(self) -> bool:
+        """Whether DataFrames are ingested through an ADBC driver instead of SQLAlchemy."""
+        return self.db_type.lower() == "postgresql_adbc"
+    
+    def _uses_pyodbc(self) -> bool:
+        """Whether SQL Server connections go through pyodbc instead of pymssql."""
+        return (
+            self.db_type.lower() == "mssql"
+            and self.connection_details.get("driver", "pymssql") == "pyodbc"
+        )
+    
+    def _insert_method(self):
+        """Return the to_sql insert method for this destination."""
+        if self.method is not None:
+            return self.method
+        if self._uses_pyodbc():
+            # Plain executemany is what fast_executemany accelerates
+            return None
+        return DEFAULT_INSERT_METHODS.get(self.db_type.lower())
+    
+    def _resolve_chunk_size(
+        self,
+        dataframe: pd.DataFrame,
+        chunk_size: Optional[int],
+        index: bool,
+        method=None
+    ) -> Optional[int]:
+        """Pick the rows-per-INSERT batch size, respecting SQL Server's parameter limit."""
+        size = chunk_size or self.chunk_size
+        method = method or self._insert_method()
         
-        if self.db_type.lower() == "sqlite":
-            # For SQLite, use the database filename from connection_details or database_name
-            db_file = conn.get("database") or f"{self.database_name}.db"
-            return f"sqlite:///{db_file}"
-        
-        elif self.db_type.lower() == "postgresql":
-            user = conn.get("user", "postgres")
-            password = conn.get("password", "")
-            host = conn.get("host", "localhost")
-            port = conn.get("port", 5432)
-            database = conn.get("database", self.database_name)
-            
-            if password:
-                return f"postgresql://{user}:{password}@{host}:{port}/{database}"
-            else:
-                return f"postgresql://{user}@{host}:{port}/{database}"
-        
-        elif self.db_type.lower() == "mssql":
-            user = conn.get("user", "root")
-            password = conn.get("password", "")
-            host = conn.get("host", "localhost")
-            port = conn.get("port", 1433)
-            database = conn.get("database", self.database_name)
-            
-            # Use pymssql driver for SQL Server to avoid requiring ODBC drivers
-            # SQLAlchemy connection string for pymssql:
-            #   mssql+pymssql://<user>:<password>@<host>:<port>/<database>
-            # URL-encode credentials to safely include special characters (e.g. '@')
-            user_enc = quote_plus(user) if user else ""
-            if password:
-                password_enc = quote_plus(password)
-                return f"mssql+pymssql://{user_enc}:{password_enc}@{host}:{port}/{database}"
-            else:
-                return f"mssql+pymssql://{user_enc}@{host}:{port}/{database}"
+        if self.db_type.lower() == "mssql" and method == "multi":
+            columns = len(dataframe.columns) + (1 if index else 0)
+            max_rows = max(1, (MSSQL_MAX_PARAMS - 1) // max(columns, 1))
+            size = min(size, max_rows) if size else max_rows
         
-        else:
-            raise ValueError(f"Unsupported database type: {self.db_type}")
+        return size
+    
+    @functools.cached_property
+    def engine(self):
+        """Database engine, created (or fetched from the engine cache) on first access."""
+        return self._initialize_engine()
     
-    def _initialize_engine(self) -> None:
+    def _initialize_engine(self):
         """Initialize the database engine based on the database type."""
         try:
-            connection_string = self._build_connection_string()
-            self.engine = create_engine(connection_string)
+            engine = _get_engine(self._connection_string)
             
-            self.logger.info(f"Database engine initialized for {self.db_type} database: {self.database_name}")
+            self.logger.info("Database engine initialized for %s database: %s", self.db_type, self.database_name)
+            return engine
         except Exception as e:
-            self.logger.error(f"Failed to initialize database engine: {str(e)}")
+            self.logger.error("Failed to initialize database engine: %s", e)
             raise
     
-    def test_connection(self) -> Dict[str, Any]:
+    def test_connection(self, connection=None) -> Dict[str, Any]:
         """
         Test the database connection.
         
+        Args:
+            connection: Open SQLAlchemy connection to test, so a caller can check
+                        and then load through the same connection
+                        (defaults to a pooled connection from the engine)
+        
         Returns:
             dict: Connection test result with 'success' bool and 'message' string
         """
         try:
-            with self.engine.connect() as connection:
-                connection.execute(text("SELECT 1"))
-                self.logger.info(f"Database connection test successful for {self.db_type}")
+            with nullcontext(connection) if connection is not None else self.engine.connect() as conn:
+                conn.execute(text("SELECT 1"))
+                self.logger.info("Database connection test successful for %s", self.db_type)
                 return {
                     "success": True,
                     "message": f"Successfully connected to {self.db_type} database: {self.database_name}",
@@ -127,14 +345,161 @@ class SQLDataFrameLoader:
                 "database": self.database_name
             }
     
+    def _should_stream(self, n_rows: int, index: bool) -> bool:
+        """Whether a DataFrame is large enough to bypass to_sql's full-frame conversion."""
+        return (
+            self.stream_threshold is not None
+            and n_rows > self.stream_threshold
+            and not index
+            and self._insert_method() is not psql_insert_copy
+        )
+    
+    def _insert_workers(self) -> int:
+        """Number of threads to use for streamed inserts."""
+        if self.db_type.lower() == "sqlite":
+            # SQLite serializes writers and shares a single pooled connection
+            return 1
+        return max(1, min(self.max_workers, MAX_INSERT_WORKERS))
+    
+    @staticmethod
+    def _downcast(dataframe: pd.DataFrame) -> pd.DataFrame:
+        """Return a copy of the DataFrame with numeric and string columns narrowed."""
+        import pandas as pd
+        
+        max_unique = len(dataframe) * CATEGORY_MAX_UNIQUE_RATIO
+        downcast = dataframe.copy(deep=False)
+        for column, dtype in dataframe.dtypes.items():
+            if pd.api.types.is_bool_dtype(dtype):
+                continue
+            if pd.api.types.is_integer_dtype(dtype):
+                downcast[column] = pd.to_numeric(dataframe[column], downcast="integer")
+            elif pd.api.types.is_float_dtype(dtype):
+                # to_numeric narrows within a tolerance; keep float32 only if it round-trips exactly
+                narrowed = pd.to_numeric(dataframe[column], downcast="float")
+                if narrowed.astype(dtype).equals(dataframe[column]):
+                    downcast[column] = narrowed
+            elif dtype == object and dataframe[column].nunique() <= max_unique:
+                downcast[column] = dataframe[column].astype("category")
+        return downcast
+    
+    @staticmethod
+    def _chunk_params(dataframe: pd.DataFrame, columns: list, start: int, stop: int) -> list:
+        """
+        Build executemany parameters for rows start:stop, mapping NaN to NULL.
+        
+        Each column is sliced and converted on its own, so no object-dtype copy
+        of the whole chunk is made and NaN handling is skipped for columns
+        without missing values.
+        """
+        values = []
+        for position in range(len(columns)):
+            column = dataframe.iloc[start:stop, position]
+            if column.hasnans:
+                column = column.astype(object).where(column.notna(), None)
+            values.append(column.tolist())
+        return [dict(zip(columns, row)) for row in zip(*values)]
+    
+    def _insert_chunk(self, insert_stmt, dataframe: pd.DataFrame, columns: list, start: int, stop: int) -> None:
+        """Insert rows start:stop in their own transaction."""
+        with self.engine.begin() as connection:
+            connection.execute(insert_stmt, self._chunk_params(dataframe, columns, start, stop))
+    
+    def _insert_target(self, dataframe: pd.DataFrame, table: str, behavior: str, connection) -> Table:
+        """
+        Create the target table if needed and return it as a reflected Table.
+        
+        Appends to a table this loader has already reflected reuse the cached
+        Table, so chunked loads reflect the table only once. The table's
+        existence is still checked on every append, since another process may
+        have dropped it since it was reflected.
+        """
+        metadata = self._fresh_metadata()
+        exists = behavior == "append" and inspect(connection).has_table(table)
+        if exists and table in metadata.tables:
+            return metadata.tables[table]
+        
+        if not exists:
+            dataframe.head(0).to_sql(table, connection, if_exists=behavior, index=False)
+        if table in metadata.tables:
+            metadata.remove(metadata.tables[table])
+        return Table(table, metadata, autoload_with=connection)
+    
+    def _fast_insert(
+        self,
+        dataframe: pd.DataFrame,
+        table: str,
+        behavior: str,
+        chunk_size: Optional[int],
+        connection=None
+    ) -> None:
+        """
+        Insert a DataFrame chunk by chunk with a Core INSERT statement.
+        
+        to_sql converts the whole frame to row form before slicing it into
+        chunks; slicing the column arrays per chunk keeps peak memory close to
+        the DataFrame itself. The table is created (or replaced) from the
+        DataFrame's empty head unless rows are appended to an existing table.
+        
+        With a single worker everything runs in one transaction. With several
+        workers each chunk is inserted concurrently in its own transaction, so
+        a failure rolls back only the chunks that have not committed yet.
+        A caller-supplied connection is always used serially, inside the
+        caller's transaction.
+        """
+        size = chunk_size or STREAM_CHUNK_SIZE
+        columns = [str(column) for column in dataframe.columns]
+        bounds = [(start, start + size) for start in range(0, len(dataframe), size)]
+        workers = 1 if connection is not None else self._insert_workers()
+        
+        with nullcontext(connection) if connection is not None else self.engine.begin() as connection:
+            insert_stmt = self._insert_target(dataframe, table, behavior, connection).insert()
+            
+            if workers == 1:
+                for start, stop in bounds:
+                    connection.execute(insert_stmt, self._chunk_params(dataframe, columns, start, stop))
+                return
+        
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = [
+                executor.submit(self._insert_chunk, insert_stmt, dataframe, columns, start, stop)
+                for start, stop in bounds
+            ]
+            for future in futures:
+                future.result()
+    
+    def _adbc_ingest(self, data, table: str, behavior: str, index: bool = False) -> int:
+        """
+        Bulk load a DataFrame, pyarrow Table or RecordBatchReader with ADBC's adbc_ingest.
+        
+        The data is handed to the driver as Arrow buffers, so no per-row
+        Python objects are created. Requires pyarrow and adbc-driver-postgresql.
+        
+        Returns:
+            int: Number of rows ingested as reported by the driver
+        """
+        import pyarrow as pa
+        import adbc_driver_postgresql.dbapi as adbc_postgresql
+        
+        if not isinstance(data, (pa.Table, pa.RecordBatchReader)):
+            data = pa.Table.from_pandas(data, preserve_index=index)
+        
+        with adbc_postgresql.connect(self._connection_string) as connection:
+            with connection.cursor() as cursor:
+                rows = cursor.adbc_ingest(table, data, mode=ADBC_INGEST_MODES[behavior])
+            connection.commit()
+        return rows
+    
     def load_dataframe_to_sql(
         self,
         dataframe: pd.DataFrame,
         table_name: Optional[str] = None,
         if_exists: Optional[str] = None,
         index: bool = False,
-        chunk_size: Optional[int] = None
-    ) -> bool:
+        chunk_size: Optional[int] = None,
+        method=None,
+        connection=None,
+        downcast: bool = False
+    ) -> Dict[str, Any]:
         """
         Load a pandas DataFrame to the SQL database.
         
@@ -144,44 +509,172 @@ class SQLDataFrameLoader:
             if_exists: How to behave if table exists ('fail', 'replace', 'append')
                       (if not provided, uses destination config or defaults to 'replace')
             index: Whether to write DataFrame index as a column
-            chunk_size: Number of rows to write at a time (None = all at once)
+            chunk_size: Number of rows to write at a time (defaults to the loader's chunk_size)
+            method: to_sql insert method for this call ('multi' or a callable);
+                    defaults to the loader's choice for the database type
+            connection: Open SQLAlchemy connection to write through, so several
+                        loads can share one connection and transaction
+                        (defaults to a pooled connection from the engine)
+            downcast: Shrink numeric columns to the smallest dtype that holds their
+                      values exactly, and repetitive string columns to categories, before
+                      inserting; new tables get correspondingly narrower column types
         
         Returns:
-            bool: True if loading was successful, False otherwise
+            dict: Load result with 'success' bool, 'table', 'rows_loaded' and,
+                  on failure, a 'message' string
         """
+        # Get table name from parameter or destination config
+        table = table_name or self.destination.get("table")
+        
         try:
-            # Get table name from parameter or destination config
-            table = table_name or self.destination.get("table")
             if not table:
-                self.logger.error("Table name must be provided in parameter or destination config")
-                return False
+                error_msg = "Table name must be provided in parameter or destination config"
+                self.logger.error(error_msg)
+                return self._load_result(False, table, message=error_msg)
             
             # Get if_exists from parameter or destination config
             behavior = if_exists or self.destination.get("if_exists", "replace")
             
-            if dataframe.empty:
-                self.logger.warning(f"DataFrame is empty. No data will be loaded to table '{table}'")
-                return False
+            n_rows = len(dataframe)
+            if not n_rows:
+                warning_msg = f"DataFrame is empty. No data will be loaded to table '{table}'"
+                self.logger.warning(warning_msg)
+                return self._load_result(False, table, message=warning_msg)
             
-            self.logger.info(f"Starting to load DataFrame to table '{table}' ({len(dataframe)} rows)")
+            if downcast:
+                dataframe = self._downcast(dataframe)
             
-            dataframe.to_sql(
-                table,
-                self.engine,
-                if_exists=behavior,
-                index=index,
-                chunksize=chunk_size
-            )
+            self.logger.info("Starting to load DataFrame to table '%s' (%d rows)", table, n_rows)
             
-            self.logger.info(f"Successfully loaded {len(dataframe)} rows to table '{table}'")
-            return True
+            loaded = streamed = False
+            try:
+                if self._uses_adbc() and method is None and connection is None:
+                    self._adbc_ingest(dataframe, table, behavior, index)
+                elif method is None and self._should_stream(n_rows, index):
+                    streamed = True
+                    self._fast_insert(dataframe, table, behavior, chunk_size, connection)
+                else:
+                    insert_method = method or self._insert_method()
+                    dataframe.to_sql(
+                        table,
+                        connection if connection is not None else self.engine,
+                        if_exists=behavior,
+                        index=index,
+                        method=insert_method,
+                        chunksize=self._resolve_chunk_size(dataframe, chunk_size, index, insert_method)
+                    )
+                loaded = True
+            finally:
+                # A successful append leaves column definitions as they were, and a
+                # streamed load has just reflected the table it wrote
+                self._invalidate_schema_cache(
+                    schema_changed=not (loaded and behavior == "append"),
+                    keep_table=table if loaded and streamed else None,
+                )
+            
+            self.logger.info("Successfully loaded %d rows to table '%s'", n_rows, table)
+            return self._load_result(True, table, rows_loaded=n_rows)
         
         except SQLAlchemyError as e:
-            self.logger.error(f"SQLAlchemy error while loading data: {str(e)}")
-            return False
+            error_msg = f"SQLAlchemy error while loading data: {str(e)}"
+            self.logger.error(error_msg)
+            return self._load_result(False, table, message=error_msg)
         except Exception as e:
-            self.logger.error(f"Unexpected error while loading DataFrame: {str(e)}")
-            return False
+            error_msg = f"Unexpected error while loading DataFrame: {str(e)}"
+            self.logger.error(error_msg)
+            return self._load_result(False, table, message=error_msg)
+    
+    @staticmethod
+    def _load_result(
+        success: bool,
+        table: Optional[str],
+        rows_loaded: int = 0,
+        message: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Build the result dict returned by load_dataframe_to_sql."""
+        result = {"success": success, "table": table, "rows_loaded": rows_loaded}
+        if message:
+            result["message"] = message
+        return result
+    
+    def _load_frames(self, frames, table_name: Optional[str], behavior: str) -> Dict[str, Any]:
+        """
+        Load an iterable of DataFrames into one table through a single transaction.
+        
+        The first frame is written using ``behavior`` and the rest are appended.
+        If any frame fails, everything written so far is rolled back and that
+        frame's failure result is returned.
+        """
+        total_rows = 0
+        result = self._load_result(False, table_name, message="No data to load")
+        
+        with self.engine.connect() as connection:
+            transaction = connection.begin()
+            for frame in frames:
+                result = self.load_dataframe_to_sql(frame, table_name, behavior, connection=connection)
+                if not result["success"]:
+                    transaction.rollback()
+                    # Tables created or replaced by earlier frames no longer exist as reflected
+                    self._invalidate_schema_cache()
+                    return result
+                behavior = "append"
+                total_rows += result["rows_loaded"]
+            transaction.commit()
+        
+        if total_rows:
+            result = self._load_result(True, result["table"], rows_loaded=total_rows)
+        return result
+    
+    def load_arrow_stream_to_sql(
+        self,
+        reader,
+        table_name: Optional[str] = None,
+        if_exists: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Load a stream of Arrow record batches to the SQL database.
+        
+        For postgresql_adbc the reader is handed to adbc_ingest as-is, so the
+        data never becomes pandas objects. Other databases convert one batch at
+        a time to a DataFrame and load all batches in a single transaction.
+        
+        Args:
+            reader: pyarrow RecordBatchReader (e.g. from pyarrow.csv.open_csv)
+            table_name: Name of the table to create/update (if not in destination config)
+            if_exists: How to behave if table exists ('fail', 'replace', 'append')
+        
+        Returns:
+            dict: Load result in the same form as load_dataframe_to_sql
+        """
+        table = table_name or self.destination.get("table")
+        if not table:
+            error_msg = "Table name must be provided in parameter or destination config"
+            self.logger.error(error_msg)
+            return self._load_result(False, table, message=error_msg)
+        
+        behavior = if_exists or self.destination.get("if_exists", "replace")
+        
+        try:
+            if self._uses_adbc():
+                rows = self._adbc_ingest(reader, table, behavior)
+                result = self._load_result(True, table, rows_loaded=rows)
+            else:
+                result = self._load_frames((batch.to_pandas() for batch in reader), table, behavior)
+            
+            if result["success"]:
+                self.logger.info("Successfully streamed %d rows to table '%s'", result["rows_loaded"], table)
+            return result
+        
+        except SQLAlchemyError as e:
+            error_msg = f"SQLAlchemy error while streaming data: {str(e)}"
+            self.logger.error(error_msg)
+            return self._load_result(False, table, message=error_msg)
+        except Exception as e:
+            error_msg = f"Unexpected error while streaming record batches: {str(e)}"
+            self.logger.error(error_msg)
+            return self._load_result(False, table, message=error_msg)
+        finally:
+            self._invalidate_schema_cache()
     
     def load_csv_to_database(
         self,
@@ -193,83 +686,233 @@ class SQLDataFrameLoader:
         """
         Load data from a CSV file to the SQL database.
         
+        The file is read in chunks so that only one chunk is held in memory
+        at a time. The first chunk is written using ``if_exists`` and every
+        following chunk is appended to the same table. All chunks share one
+        connection and transaction, so a failed load leaves the table as it was.
+        
         Args:
             csv_file_path: Path to the CSV file
             table_name: Name of the table to create/update (if not in destination config)
             if_exists: How to behave if table exists ('fail', 'replace', 'append')
             **kwargs: Additional arguments to pass to pd.read_csv()
+                      (``chunksize`` defaults to 100000 rows)
         
         Returns:
             bool: True if loading was successful, False otherwise
         """
+        import pandas as pd
+        
         try:
-            self.logger.info(f"Reading CSV file: {csv_file_path}")
-            dataframe = pd.read_csv(csv_file_path, **kwargs)
-            self.logger.info(f"CSV file loaded successfully with {len(dataframe)} rows")
+            chunksize = kwargs.pop("chunksize", 100_000)
+            kwargs.setdefault("memory_map", True)
+            behavior = if_exists or self.destination.get("if_exists", "replace")
+            
+            self.logger.info("Reading CSV file: %s", csv_file_path)
+            reader = pd.read_csv(csv_file_path, chunksize=chunksize, **kwargs)
+            
+            result = self._load_frames(reader, table_name, behavior)
+            if not result["success"]:
+                return False
             
-            return self.load_dataframe_to_sql(dataframe, table_name, if_exists)
+            self.logger.info("CSV file loaded successfully with %d rows", result["rows_loaded"])
+            return result["rows_loaded"] > 0
         
         except FileNotFoundError:
-            self.logger.error(f"CSV file not found: {csv_file_path}")
+            self.logger.error("CSV file not found: %s", csv_file_path)
             return False
         except pd.errors.ParserError as e:
-            self.logger.error(f"Error parsing CSV file '{csv_file_path}': {str(e)}")
+            self.logger.error("Error parsing CSV file '%s': %s", csv_file_path, e)
             return False
         except Exception as e:
-            self.logger.error(f"Unexpected error while loading CSV file: {str(e)}")
+            self.logger.error("Unexpected error while loading CSV file: %s", e)
             return False
     
+    def load_csv_direct(
+        self,
+        csv_file_path: str,
+        table_name: Optional[str] = None,
+        if_exists: Optional[str] = None
+    ) -> bool:
+        """
+        Load a CSV file without building DataFrames for its rows.
+        
+        For PostgreSQL the file is streamed to COPY ... FROM STDIN so the server
+        parses it; only a sample of rows is read with pandas to create the table.
+        Other databases fall back to the chunked load_csv_to_database.
+        
+        Column types are inferred from the first COPY_SCHEMA_SAMPLE_ROWS rows
+        only, so a value further down that does not fit its column (text in a
+        numeric column, say) makes the COPY fail. As in COPY, only empty cells
+        count as missing; text such as ``NA`` or ``NULL`` is kept as text.
+        
+        Args:
+            csv_file_path: Path to the CSV file (with a header row)
+            table_name: Name of the table to create/update (if not in destination config)
+            if_exists: How to behave if table exists ('fail', 'replace', 'append')
+        
+        Returns:
+            bool: True if loading was successful, False otherwise
+        """
+        if self.db_type.lower() not in ("postgresql", "postgresql_adbc"):
+            return self.load_csv_to_database(csv_file_path, table_name, if_exists)
+        
+        table = table_name or self.destination.get("table")
+        if not table:
+            self.logger.error("Table name must be provided in parameter or destination config")
+            return False
+        
+        behavior = if_exists or self.destination.get("if_exists", "replace")
+        
+        import pandas as pd
+        
+        try:
+            # COPY ... WITH CSV reads only empty cells as NULL, so the sample must too
+            sample = pd.read_csv(
+                csv_file_path, nrows=COPY_SCHEMA_SAMPLE_ROWS, keep_default_na=False, na_values=[""]
+            )
+            columns = ", ".join(f'"{column}"' for column in sample.columns)
+            
+            self.logger.info("Copying CSV file '%s' to table '%s'", csv_file_path, table)
+            with self.engine.begin() as connection, open(csv_file_path, encoding="utf-8") as csv_file:
+                sample.head(0).to_sql(table, connection, if_exists=behavior, index=False)
+                with connection.connection.cursor() as cursor:
+                    cursor.copy_expert(f'COPY "{table}" ({columns}) FROM STDIN WITH CSV HEADER', csv_file)
+            
+            self.logger.info("Successfully copied CSV file to table '%s'", table)
+            return True
+        
+        except FileNotFoundError:
+            self.logger.error("CSV file not found: %s", csv_file_path)
+            return False
+        except SQLAlchemyError as e:
+            self.logger.error("SQLAlchemy error while copying CSV file: %s", e)
+            return False
+        except Exception as e:
+            self.logger.error("Unexpected error while copying CSV file: %s", e)
+            return False
+        finally:
+            self._invalidate_schema_cache()
+    
+    @property
+    def inspector(self):
+        """Schema inspector for the engine, shared with other loaders on the same engine."""
+        schema_cache = self._shared_schema_cache()
+        schema_cache.expire_if_stale()
+        return schema_cache.inspector
+    
+    def _shared_schema_cache(self) -> _SchemaCache:
+        """Schema cache shared with other loaders on the same engine."""
+        if self._schema_cache is None:
+            self._schema_cache = _get_schema_cache(self.engine)
+        return self._schema_cache
+    
+    def _fresh_metadata(self) -> MetaData:
+        """
+        Return the loader's reflected tables.
+        
+        They are emptied first if they are older than SCHEMA_CACHE_TTL or a
+        loader on the same engine has since written something that may have
+        changed a table's columns.
+        """
+        if (
+            time.monotonic() - self._metadata_loaded_at >= SCHEMA_CACHE_TTL
+            or self._metadata_loaded_at < self._shared_schema_cache().changed_at
+        ):
+            self._clear_metadata()
+        return self._metadata
+    
+    def _clear_metadata(self) -> None:
+        """Forget every reflected table and restart the TTL."""
+        self._metadata.clear()
+        self._metadata_loaded_at = time.monotonic()
+    
+    def _invalidate_schema_cache(self, schema_changed: bool = True, keep_table: Optional[str] = None) -> None:
+        """
+        Drop cached table metadata after a write through this loader.
+        
+        The shared inspector cache is cleared either way, since the write may
+        have created a table. Unless ``schema_changed`` is False (the write only
+        added rows), every loader on the engine also drops its reflected tables;
+        this loader keeps ``keep_table`` when it has just reflected it itself.
+        
+        A loader that has not created its engine (an ADBC-only load) has no
+        shared cache to clear, and building the engine here could fail after
+        the rows were committed.
+        """
+        if "engine" in self.__dict__:
+            self._shared_schema_cache().clear(schema_changed)
+        if not schema_changed:
+            return
+        
+        # keep_table was reflected inside the write, after it was (re)created
+        for reflected in list(self._metadata.tables.values()):
+            if reflected.name != keep_table:
+                self._metadata.remove(reflected)
+        self._metadata_loaded_at = time.monotonic()
+    
     def get_table_info(self, table_name: str) -> Optional[dict]:
         """
         Get information about a table in the database.
         
+        The table is reflected once into the loader's MetaData and served from
+        there until the next write that may change its schema, or for at most
+        SCHEMA_CACHE_TTL seconds so changes made elsewhere are picked up.
+        
         Args:
             table_name: Name of the table to inspect
         
         Returns:
             dict: Information about the table, or None if table doesn't exist
         """
-        try:
-            inspector = inspect(self.engine)
-            
-            if not inspector.has_table(table_name):
-                self.logger.warning(f"Table '{table_name}' does not exist in the database")
+        metadata = self._fresh_metadata()
+        if table_name not in metadata.tables:
+            try:
+                metadata.reflect(self.engine, only=[table_name])
+            except InvalidRequestError:
+                self.logger.warning("Table '%s' does not exist in the database", table_name)
+                return None
+            except SQLAlchemyError as e:
+                self.logger.error("Error inspecting table '%s': %s", table_name, e)
                 return None
-            
-            columns = inspector.get_columns(table_name)
-            self.logger.info(f"Table '{table_name}' has {len(columns)} columns")
-            
-            return {
-                "table_name": table_name,
-                "columns": [col["name"] for col in columns],
-                "column_count": len(columns)
-            }
         
-        except Exception as e:
-            self.logger.error(f"Error inspecting table '{table_name}': {str(e)}")
-            return None
+        columns = [column.name for column in metadata.tables[table_name].columns]
+        self.logger.info("Table '%s' has %d columns", table_name, len(columns))
+        
+        return {
+            "table_name": table_name,
+            "columns": columns,
+            "column_count": len(columns)
+        }
     
     def list_tables(self) -> list:
         """
         List all tables in the database.
         
+        Names come from the shared inspector, which caches them until the next
+        write through a loader on the same engine or for SCHEMA_CACHE_TTL seconds.
+        
         Returns:
             list: Names of all tables in the database
+        
+        Raises:
+            SQLAlchemyError: If the table names cannot be read
         """
-        try:
-            inspector = inspect(self.engine)
-            tables = inspector.get_table_names()
-            self.logger.info(f"Database contains {len(tables)} table(s): {tables}")
-            return tables
-        except Exception as e:
-            self.logger.error(f"Error listing tables: {str(e)}")
-            return []
+        tables = self.inspector.get_table_names()
+        self.logger.info("Database contains %d table(s): %s", len(tables), tables)
+        return tables
     
     def close(self) -> None:
-        """Close the database connection."""
+        """
+        Close the database connection.
+        
+        Disposes the pooled connections of the shared engine; the engine stays
+        cached and reconnects on next use.
+        """
         try:
-            if self.engine:
+            # Only dispose an engine this loader actually used
+            if "engine" in self.__dict__:
                 self.engine.dispose()
                 self.logger.info("Database connection closed successfully")
         except Exception as e:
-            self.logger.error(f"Error closing database connection: {str(e)}")
+            self.logger.error("Error closing database connection: %s", e)
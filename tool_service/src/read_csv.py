@@ -1,35 +1,303 @@
+from __future__ import annotations
 
-import pandas as pd
-from typing import Union, Dict
+import hashlib
+import importlib.util
+import os
+import tempfile
+from typing import TYPE_CHECKING, Iterator, Optional, Union, Dict
 from tool_service.util.logger import get_logger
 
-logger = get_logger(__name__)
+if TYPE_CHECKING:
+    # pandas, numpy and pyarrow are imported where they are used so that
+    # importing the loader stays cheap
+    import pandas as pd
+
+PYARROW_AVAILABLE = importlib.util.find_spec("pyarrow") is not None
+
+logger = _default_logger = get_logger(__name__)
+
+# Rows sampled to pick dtype hints when none are supplied
+DTYPE_SAMPLE_ROWS = 10_000
+# String columns with at most this share of distinct values are read as categories
+CATEGORY_MAX_UNIQUE_RATIO = 0.5
+# Bytes per block handed to each pyarrow CSV parser thread
+ARROW_BLOCK_SIZE = 8 << 20
+# Feather schema metadata key recording which version of the source CSV was cached
+CACHE_SIGNATURE_KEY = b"source_signature"
+# Cells pandas' C parser reads as NA by default; pyarrow is given the same list
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+
+def _arrow_convert_options(column_types=None, **convert_options):
+    """pyarrow ConvertOptions that treat missing cells the way pandas does.
+
+    Empty and NA-like cells become nulls in every column, text included, so
+    they load as NULL whichever parser read the file.
+    """
+    from pyarrow import csv as pa_csv
+
+    convert_options.setdefault("strings_can_be_null", True)
+    convert_options.setdefault("null_values", PANDAS_NA_VALUES)
+    return pa_csv.ConvertOptions(column_types=column_types or {}, **convert_options)
+
+
+def read_csv_arrow(file_path: str, column_types=None, **convert_options):
+    """Read a CSV file into a pyarrow Table using multithreaded block parsing.
+
+    ``column_types`` is a dict or pyarrow Schema of column types; any other
+    keyword arguments are passed to ``pyarrow.csv.ConvertOptions``.
+    """
+    from pyarrow import csv as pa_csv
+
+    read_options = pa_csv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE)
+    convert_options = _arrow_convert_options(column_types, **convert_options)
+    return pa_csv.read_csv(file_path, read_options=read_options, convert_options=convert_options)
+
+
+def _arrow_column_types(dtypes: Optional[Dict[str, str]]) -> Dict:
+    """Translate pandas dtype hints into pyarrow column types."""
+    import numpy as np
+    import pyarrow as pa
+
+    column_types = {}
+    for column, dtype in (dtypes or {}).items():
+        if dtype == "category":
+            column_types[column] = pa.dictionary(pa.int32(), pa.string())
+        else:
+            column_types[column] = pa.from_numpy_dtype(np.dtype(dtype))
+    return column_types
+
+
+def _schema_dtypes(schema) -> Dict:
+    """Arrow-backed pandas dtypes for the columns of a pyarrow Schema."""
+    import pandas as pd
+
+    return {field.name: pd.ArrowDtype(field.type) for field in schema}
+
+
+def _arrow_types_mapper(arrow_type):
+    """Keep columns Arrow-backed, except dictionary columns which become categoricals."""
+    import pandas as pd
+    import pyarrow as pa
+
+    if pa.types.is_dictionary(arrow_type):
+        return None
+    return pd.ArrowDtype(arrow_type)
 
 
 class CSVLoader:
-    def __init__(self, logger=None):
-        """Initialize CSVLoader with optional logger."""
-        self.logger = logger if logger else get_logger(__name__)
+    def __init__(self, logger=None, cache_dir: Optional[str] = None):
+        """Initialize CSVLoader with optional logger, defaulting to the module logger.
+
+        With ``cache_dir`` set (and pyarrow installed), parsed files are kept
+        there as Feather files and memory-mapped on later loads until the
+        source CSV's modification time or size changes.
+        """
+        self.logger = logger or _default_logger
+        self.cache_dir = cache_dir
 
-    def load_csv(self, file_path: str) -> Union[pd.DataFrame, Dict]:
-        """Load data from CSV file and return as DataFrame."""
-        self.logger.info(f"CSVLoader started loading")
+    def load_csv(
+        self,
+        file_path: str,
+        chunksize: Optional[int] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+        schema=None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame], Dict]:
+        """Load data from CSV file and return as DataFrame.
+
+        When ``chunksize`` is given, an iterator of DataFrames is returned
+        instead so callers can process the file one chunk at a time.
+        ``dtypes`` maps column names to dtypes so the parser can skip type
+        inference; without it, low-cardinality string columns found in a
+        sample of the file are read as categories. ``schema`` is a pyarrow
+        Schema used instead of ``dtypes``: its columns are parsed as the given
+        Arrow types, with no sampling pass, and string columns are
+        dictionary-encoded by pyarrow.
+        """
+        self.logger.info("CSVLoader started loading")
 
         try:
-            df = pd.read_csv(file_path)
-            self.logger.info(f"Successfully read {len(df)} rows from CSV")
+            # Cached tables hold the inferred dtypes, so explicit hints bypass the cache
+            inferred = dtypes is None and schema is None
+            cache_path = self._cache_path(file_path) if inferred and not chunksize else None
+            cached = self._read_cache(cache_path, file_path) if cache_path else None
+            if cached is not None:
+                self.logger.info("Read %d rows from CSV cache %s", len(cached), cache_path)
+                return cached
+
+            if inferred:
+                dtypes = self._infer_dtypes(file_path, chunksize)
+
+            if chunksize:
+                if schema is not None:
+                    dtypes = _schema_dtypes(schema)
+                reader = self._read_csv_file(file_path, chunksize=chunksize, dtypes=dtypes)
+                self.logger.info("Streaming CSV in chunks of %d rows", chunksize)
+                return reader
+
+            df = self._read_csv_file(file_path, dtypes=dtypes, cache_path=cache_path, schema=schema)
+            self.logger.info("Successfully read %d rows from CSV", len(df))
             return df
         except FileNotFoundError:
-            self.logger.error(f"CSV file not found: {file_path}")
+            self.logger.error("CSV file not found: %s", file_path)
             return {
                 "status": "failed",
                 "error": f"File not found: {file_path}"
             }
         except Exception as e:
-            self.logger.error(f"Error loading CSV file", exc_info=True)
+            self.logger.error("Error loading CSV file", exc_info=True)
             return {
                 "status": "failed",
                 "error": str(e)
             }
 
+    def open_csv_stream(self, file_path: str):
+        """Open a CSV file as a pyarrow stream of record batches.
+
+        Batches are parsed on demand, so the file never has to fit in
+        memory and no pandas objects are created. Requires pyarrow.
+        """
+        from pyarrow import csv as pa_csv
+
+        self.logger.info("Opening CSV stream for %s", file_path)
+        read_options = pa_csv.ReadOptions(use_threads=True, block_size=ARROW_BLOCK_SIZE)
+        return pa_csv.open_csv(
+            file_path, read_options=read_options, convert_options=_arrow_convert_options()
+        )
+
+    def _cache_path(self, file_path: str) -> Optional[str]:
+        """Feather cache location for a CSV file, or None when caching is off."""
+        if not (self.cache_dir and PYARROW_AVAILABLE):
+            return None
+        digest = hashlib.sha1(os.path.abspath(file_path).encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.cache_dir, f"{os.path.basename(file_path)}-{digest}.feather")
+
+    @staticmethod
+    def _source_signature(file_path: str) -> bytes:
+        """Identify the current version of a source file by mtime and size."""
+        stat = os.stat(file_path)
+        return f"{stat.st_mtime_ns}:{stat.st_size}".encode("utf-8")
+
+    def _read_cache(self, cache_path: str, file_path: str) -> Optional[pd.DataFrame]:
+        """Memory-map a cached Feather file, or return None if it is missing, stale or unreadable."""
+        if not os.path.exists(cache_path):
+            return None
+
+        import pyarrow as pa
+        from pyarrow import feather
+
+        try:
+            table = feather.read_table(cache_path, memory_map=True)
+            metadata = table.schema.metadata or {}
+            if metadata.get(CACHE_SIGNATURE_KEY) != self._source_signature(file_path):
+                return None
+            return table.to_pandas(types_mapper=_arrow_types_mapper, split_blocks=True)
+        except (pa.ArrowException, OSError):
+            # A truncated or corrupt cache is re-parsed from the CSV and rewritten
+            self.logger.warning("Ignoring unreadable CSV cache %s", cache_path)
+            return None
+
+    def _write_cache(self, table, cache_path: str, file_path: str) -> None:
+        """Store a parsed table as an uncompressed Feather file so it can be memory-mapped.
+
+        The file is written under a temporary name and moved into place, so
+        frames still mapped from the previous cache keep their own copy
+        instead of seeing it truncated underneath them.
+        """
+        from pyarrow import feather
+
+        metadata = dict(table.schema.metadata or {})
+        metadata[CACHE_SIGNATURE_KEY] = self._source_signature(file_path)
+        cache_dir = os.path.dirname(cache_path) or "."
+        os.makedirs(cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".tmp")
+        os.close(fd)
+        try:
+            feather.write_feather(
+                table.replace_schema_metadata(metadata), tmp_path, compression="uncompressed"
+            )
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _infer_dtypes(self, file_path: str, chunksize: Optional[int] = None) -> Optional[Dict[str, str]]:
+        """Sample the head of a CSV file and return category hints for repetitive string columns.
+
+        The sample is parsed by the same reader as the full load, so only
+        columns that reader keeps as text (and not, say, as dates) get hints.
+        """
+        if PYARROW_AVAILABLE and not chunksize:
+            return self._infer_arrow_dtypes(file_path)
+
+        import pandas as pd
+        
+        sample = pd.read_csv(file_path, nrows=DTYPE_SAMPLE_ROWS)
+        max_unique = len(sample) * CATEGORY_MAX_UNIQUE_RATIO
+        dtypes = {
+            column: "category"
+            for column in sample.select_dtypes(include="object").columns
+            if sample[column].nunique() <= max_unique
+        }
+        return dtypes or None
+
+    def _infer_arrow_dtypes(self, file_path: str) -> Optional[Dict[str, str]]:
+        """Category hints for repetitive columns pyarrow reads as strings."""
+        import pyarrow as pa
+        import pyarrow.compute as pc
+        from pyarrow import csv as pa_csv
+
+        read_options = pa_csv.ReadOptions(block_size=ARROW_BLOCK_SIZE)
+        reader = pa_csv.open_csv(
+            file_path, read_options=read_options, convert_options=_arrow_convert_options()
+        )
+        try:
+            sample = reader.read_next_batch().slice(0, DTYPE_SAMPLE_ROWS)
+        except StopIteration:
+            return None
+        finally:
+            reader.close()
+
+        max_unique = sample.num_rows * CATEGORY_MAX_UNIQUE_RATIO
+        dtypes = {
+            field.name: "category"
+            for field, column in zip(sample.schema, sample.columns)
+            if pa.types.is_string(field.type) and pc.count_distinct(column).as_py() <= max_unique
+        }
+        return dtypes or None
+
+    def _read_csv_file(
+        self,
+        file_path: str,
+        chunksize: Optional[int] = None,
+        dtypes: Optional[Dict[str, str]] = None,
+        cache_path: Optional[str] = None,
+        schema=None,
+    ) -> Union[pd.DataFrame, Iterator[pd.DataFrame]]:
+        """Read a CSV file, optionally as an iterator of chunks.
 
+        Whole-file reads use the multithreaded pyarrow CSV reader with
+        Arrow-backed columns when pyarrow is installed. That reader builds a
+        whole table, so chunked reads always use the C parser, which
+        memory-maps the file instead of copying it through Python IO.
+        """
+        if PYARROW_AVAILABLE and not chunksize:
+            if schema is not None:
+                table = read_csv_arrow(file_path, schema, auto_dict_encode=True)
+            else:
+                table = read_csv_arrow(file_path, _arrow_column_types(dtypes))
+            if cache_path:
+                self._write_cache(table, cache_path, file_path)
+            return table.to_pandas(
+                types_mapper=_arrow_types_mapper, self_destruct=True, split_blocks=True
+            )
+        
+        import pandas as pd
+        
+        return pd.read_csv(
+            file_path, chunksize=chunksize, dtype=dtypes, memory_map=True, low_memory=True
+        )
@@ -0,0 +1,28 @@
+"""Custom insert methods for DataFrame.to_sql."""
+
+import csv
+import io
+
+
+def psql_insert_copy(pd_table, conn, keys, data_iter) -> None:
+    """
+    Insert method for DataFrame.to_sql that bulk loads rows with PostgreSQL COPY.
+    
+    Rows are serialized to an in-memory CSV buffer and streamed to the server
+    with COPY ... FROM STDIN, which avoids building INSERT statements entirely.
+    
+    Args:
+        pd_table: pandas SQLTable being written
+        conn: SQLAlchemy connection with a psycopg2 DBAPI connection underneath
+        keys: Column names to insert
+        data_iter: Iterable of row tuples
+    """
+    buffer = io.StringIO()
+    csv.writer(buffer).writerows(data_iter)
+    buffer.seek(0)
+    
+    columns = ", ".join(f'"{key}"' for key in keys)
+    table = f'"{pd_table.schema}"."{pd_table.name}"' if pd_table.schema else f'"{pd_table.name}"'
+    
+    with conn.connection.cursor() as cursor:
+        cursor.copy_expert(f"COPY {table} ({columns}) FROM STDIN WITH CSV", buffer)
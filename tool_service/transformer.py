@@ -1,14 +1,28 @@
+import threading
+from collections import OrderedDict
+from typing import Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
 from tool_service.util.logger import get_logger
-from tool_service.src.read_csv import CSVLoader
+from tool_service.src.read_csv import CSVLoader, PYARROW_AVAILABLE
 from tool_service.src.load_sql import SQLDataFrameLoader as SDFL
 
 
 logger = get_logger(__name__)
 
+# SQL loaders kept per transformer; matches the engine cache size in load_sql
+MAX_SQL_LOADERS = 32
+
 
 class DataTransformer:
     def __init__(self):
         self.logger = logger
+        self.csv_loader = CSVLoader(self.logger)
+        # SQL loaders reused across calls, keyed by destination configuration,
+        # least recently used first
+        self._sql_loaders = OrderedDict()
+        self._sql_loaders_lock = threading.Lock()
 
     def transform_data(self, source: dict, destination: dict) -> dict:
         """Transform data from source to destination."""
@@ -17,21 +31,108 @@ class DataTransformer:
         source_path = source.get("path")
         table_name = destination.get("table")
 
+        if self._streams_arrow(destination):
+            SDFL_instance = self._get_sql_loader(destination)
+            # ADBC opens its own connection for the ingest, so the check runs first
+            # and no stream is left open when it fails
+            response = self._verify_connection(SDFL_instance, destination)
+            if response is not None:
+                return response
+            # Hand Arrow record batches straight to the ADBC loader, skipping pandas
+            try:
+                reader = self.csv_loader.open_csv_stream(source_path)
+            except Exception as e:
+                return self._failure_result(table_name, f"Error opening CSV stream: {str(e)}")
+            try:
+                return SDFL_instance.load_arrow_stream_to_sql(reader, table_name)
+            finally:
+                reader.close()
+
         data =  self._build_transform_result(source_path)
-        SDFL_instance = SDFL(self.logger, destination)
-        response = SDFL_instance.test_connection()
-        if response.get("success"):
-            self.logger.info(f"Connection to destination successful.")
-            load_response = SDFL_instance.load_dataframe_to_sql(data, table_name)
-            return load_response
-        
-        
-        return response
+        # CSVLoader reports a failed read as a {"status": "failed"} dict
+        if isinstance(data, dict):
+            return self._failure_result(table_name, data.get("error", "Error loading CSV file"))
+        SDFL_instance = self._get_sql_loader(destination)
+
+        try:
+            # One connection and transaction serves both the connection check and the load
+            with SDFL_instance.engine.begin() as conn:
+                response = self._verify_connection(SDFL_instance, destination, conn)
+                if response is not None:
+                    return response
+                load_response = SDFL_instance.load_dataframe_to_sql(data, table_name, connection=conn)
+                if not load_response.get("success"):
+                    conn.rollback()
+                return load_response
+        except SQLAlchemyError as e:
+            return self._failure_result(table_name, f"Database error while loading data: {str(e)}")
+
+    def _verify_connection(self, loader: SDFL, destination: dict, connection=None) -> Optional[dict]:
+        """Run the opt-in connection check; return its failure response, or None to go on loading.
+
+        The load itself surfaces connection errors, so a separate SELECT 1 only
+        runs when the destination sets ``verify_connection``.
+        """
+        if not destination.get("verify_connection", False):
+            return None
+        response = loader.test_connection(connection)
+        if not response.get("success"):
+            return response
+        self.logger.info("Connection to destination successful.")
+        return None
+
+    def _failure_result(self, table_name: Optional[str], error_msg: str) -> dict:
+        """Log an error and build a failed load result."""
+        self.logger.error(error_msg)
+        return {"success": False, "table": table_name, "rows_loaded": 0, "message": error_msg}
 
+    def _get_sql_loader(self, destination: dict) -> SDFL:
+        """Return the SQL loader for a destination, creating it on first use."""
+        key = _destination_key(destination)
+        # The transformer is shared process-wide, so requests may arrive concurrently
+        with self._sql_loaders_lock:
+            loader = self._sql_loaders.get(key)
+            if loader is None:
+                loader = self._sql_loaders[key] = SDFL(self.logger, destination)
+                if len(self._sql_loaders) > MAX_SQL_LOADERS:
+                    # Dropping the loader releases its engine to the bounded engine cache
+                    self._sql_loaders.popitem(last=False)
+            else:
+                self._sql_loaders.move_to_end(key)
+        return loader
 
+    def _streams_arrow(self, destination: dict) -> bool:
+        """Whether the destination can ingest Arrow record batches directly."""
+        return destination.get("db_type", "").lower() == "postgresql_adbc" and PYARROW_AVAILABLE
 
     def _build_transform_result(self, source_path: str) -> dict:
         """Build transformation result."""
         
-        data_csv = CSVLoader(self.logger).load_csv(source_path)
-        return data_csv
\ No newline at end of file
+        data_csv = self.csv_loader.load_csv(source_path)
+        return data_csv
+
+
+# Destination fields SQLDataFrameLoader reads; loaders are shared when these match
+LOADER_KEY_FIELDS = ("db_type", "database_name", "connection", "table", "if_exists")
+
+
+def _destination_key(destination: dict) -> tuple:
+    """Hashable key for the destination settings a SQL loader depends on."""
+    return tuple(_freeze(destination.get(field)) for field in LOADER_KEY_FIELDS)
+
+
+def _freeze(value):
+    """Recursively turn dicts and lists into hashable tuples."""
+    if isinstance(value, dict):
+        return tuple(sorted((key, _freeze(item)) for key, item in value.items()))
+    if isinstance(value, (list, tuple, set)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+_transformer = DataTransformer()
+
+
+def get_transformer() -> DataTransformer:
+    """Return the process-wide DataTransformer, so its loaders are reused across requests."""
+    return _transformer
@@ -1,74 +1,98 @@
+import atexit
+import collections
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener
 from typing import List
 
+# Most recent records kept in memory; older ones are dropped
+MAX_MEMORY_RECORDS = 10_000
+
 
 class MemoryHandler(logging.Handler):
     """Custom handler that collects logs in memory."""
     
-    def __init__(self):
-        super().__init__()
-        self.logs: List[str] = []
+    def __init__(self, capacity: int = MAX_MEMORY_RECORDS):
+        super().__init__(logging.INFO)
+        self.records = collections.deque(maxlen=capacity)
     
     def emit(self, record):
-        """Store log record in memory."""
-        self.logs.append(self.format(record))
+        """Store log record in memory; formatting is deferred to get_logs."""
+        self.records.append(record)
     
     def get_logs(self) -> List[str]:
         """Get all collected logs."""
-        return self.logs
+        return [self.format(record) for record in self.records]
     
     def clear(self):
         """Clear all logs."""
-        self.logs.clear()
+        self.records.clear()
 
 
 # Global memory handler to collect logs
 _memory_handler = MemoryHandler()
 
+_formatter = logging.Formatter(
+    "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
+)
+
+# Console handler (optional - for live viewing)
+_console_handler = logging.StreamHandler()
+_console_handler.setFormatter(_formatter)
+_memory_handler.setFormatter(_formatter)
 
-def save_logs_to_file(filepath: str = "logs/app.log") -> None:
-    """Save all collected logs to a file."""
-    os.makedirs(os.path.dirname(filepath) or ".", exist_ok=True)
-    with open(filepath, "w") as f:
-        for log in _memory_handler.get_logs():
-            f.write(log + "\n")
+# Loggers only enqueue records; a background listener formats and writes them
+_log_queue = queue.SimpleQueue()
+_listener = QueueListener(
+    _log_queue, _console_handler, _memory_handler, respect_handler_level=True
+)
+_listener.start()
+atexit.register(_listener.stop)
+
+# Serializes listener restarts, and saves with the clear that follows them
+_flush_lock = threading.RLock()
 
 
 def get_logger(name: str) -> logging.Logger:
-    """Get logger that collects logs in memory."""
+    """Get logger that hands records to the background log listener."""
     logger = logging.getLogger(name)
 
     if not logger.handlers:
         logger.setLevel(logging.INFO)
+        logger.addHandler(QueueHandler(_log_queue))
 
-        formatter = logging.Formatter(
-            "%(asctime)s | %(levelname)s | %(name)s | %(message)s"
-        )
-
-        # Console handler (optional - for live viewing)
-        console_handler = logging.StreamHandler()
-        console_handler.setFormatter(formatter)
-        logger.addHandler(console_handler)
+    return logger
 
-        # Memory handler - collects logs
-        _memory_handler.setFormatter(formatter)
-        logger.addHandler(_memory_handler)
 
-    return logger
+def flush_logs() -> None:
+    """Block until every queued record has reached the console and memory handlers."""
+    with _flush_lock:
+        _listener.stop()
+        _listener.start()
 
 
 def save_logs_to_file(log_file: str = "logs/app.log") -> None:
-    """Save all collected logs to file at the end."""
-    logs = _memory_handler.get_logs()
-    
-    os.makedirs(os.path.dirname(log_file), exist_ok=True)
-    
-    with open(log_file, 'a', encoding='utf-8') as f:
-        for log in logs:
-            f.write(log + '\n')
+    """Save all collected logs to file at the end, then clear them from memory."""
+    with _flush_lock:
+        flush_logs()
+        logs = _memory_handler.get_logs()
+        if not logs:
+            return
+        
+        os.makedirs(os.path.dirname(log_file) or ".", exist_ok=True)
+        
+        # One write for the whole batch rather than one per line
+        with open(log_file, 'a', encoding='utf-8', buffering=1 << 20) as f:
+            f.write('\n'.join(logs) + '\n')
+        
+        # Already on disk; clearing keeps a later save from appending them again
+        _memory_handler.clear()
 
 
 def clear_logs() -> None:
     """Clear all collected logs from memory."""
-    _memory_handler.clear()
\ No newline at end of file
+    with _flush_lock:
+        flush_logs()
+        _memory_handler.clear()
\ No newline at end of file